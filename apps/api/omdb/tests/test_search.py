@@ -17,12 +17,7 @@ import allure
 from infrastructure.utils.allure_helpers import api_test
 
 
-@allure.epic("OMDb API")
-@allure.feature("Movie Search & Retrieval")
-@allure.label("layer", "api")
-@allure.label("type", "functional")
 @pytest.mark.app("omdb")
-@pytest.mark.api
 class TestOmdbSearch:
     """Test suite for OMDb search operations."""
 
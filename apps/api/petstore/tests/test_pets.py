@@ -28,12 +28,7 @@ def generate_random_string(length: int = 8) -> str:
     return ''.join(random.choices(string.ascii_letters, k=length))
 
 
-@allure.epic("Petstore API")
-@allure.feature("Pet Management")
-@allure.label("layer", "api")
-@allure.label("type", "functional")
 @pytest.mark.app("petstore")
-@pytest.mark.api
 class TestPetstorePets:
     """Test suite for Petstore Pet operations."""
 
@@ -22,12 +22,7 @@ from requests import HTTPError
 from infrastructure.utils.allure_helpers import api_test
 
 
-@allure.epic("Petstore API")
-@allure.feature("Store Operations")
-@allure.label("layer", "api")
-@allure.label("type", "functional")
 @pytest.mark.app("petstore")
-@pytest.mark.api
 class TestPetstoreStore:
     """Test suite for Petstore Store operations."""
 
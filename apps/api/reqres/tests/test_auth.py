@@ -18,12 +18,7 @@ from requests import HTTPError
 from infrastructure.utils.allure_helpers import api_test
 
 
-@allure.epic("ReqRes API")
-@allure.feature("Authentication")
-@allure.label("layer", "api")
-@allure.label("type", "functional")
 @pytest.mark.app("reqres")
-@pytest.mark.api
 class TestReqResAuth:
     """Test suite for ReqRes authentication."""
 
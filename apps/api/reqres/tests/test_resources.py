@@ -9,12 +9,7 @@ import requests
 from infrastructure.utils.allure_helpers import api_test
 
 
-@allure.epic("ReqRes API")
-@allure.feature("Resource Management")
-@allure.label("layer", "api")
-@allure.label("type", "functional")
 @pytest.mark.app("reqres")
-@pytest.mark.api
 class TestReqResResources:
     """Test suite for ReqRes resource operations."""
 
@@ -18,12 +18,7 @@ import allure
 from infrastructure.utils.allure_helpers import api_test
 
 
-@allure.epic("ReqRes API")
-@allure.feature("User Management")
-@allure.label("layer", "api")
-@allure.label("type", "functional")
 @pytest.mark.app("reqres")
-@pytest.mark.api
 class TestReqResUsers:
     """Test suite for ReqRes user operations."""
 
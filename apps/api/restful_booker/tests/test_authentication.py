@@ -16,12 +16,7 @@ import pytest
 from infrastructure.utils.allure_helpers import api_test
 
 
-@allure.epic("Restful Booker API")
-@allure.feature("Authentication")
-@allure.label("layer", "api")
-@allure.label("type", "functional")
 @pytest.mark.app("restful_booker")
-@pytest.mark.api
 class TestAuthentication:
     """Test suite for Restful Booker authentication."""
 
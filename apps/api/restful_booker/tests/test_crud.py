@@ -17,12 +17,7 @@ import pytest
 from infrastructure.utils.allure_helpers import api_test
 
 
-@allure.epic("Restful Booker API")
-@allure.feature("Booking Management")
-@allure.label("layer", "api")
-@allure.label("type", "functional")
 @pytest.mark.app("restful_booker")
-@pytest.mark.api
 class TestBookingCRUD:
     """Test suite for booking CRUD operations."""
 
@@ -1,7 +1,13 @@
 """The Internet App E2E Fixtures."""
 
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
 import pytest
-from playwright.sync_api import Page
+from playwright.sync_api import Browser, BrowserContext, Dialog, Error, Page, Route
 
 from apps.e2e.the_internet.pages.login_page import LoginPage
 from apps.e2e.the_internet.pages.checkboxes_page import CheckboxesPage
@@ -33,6 +39,7 @@ from apps.e2e.the_internet.pages.edge_cases_pages import (
     ChallengingDOMPage,
     InfiniteScrollPage
 )
+from infrastructure.hooks.unified_reporting import REPORT_KEYS
 
 
 @pytest.fixture(scope="session")
@@ -44,6 +51,255 @@ def the_internet_config(app_configs):
     return config
 
 
+# The Internet pages are small and static; fail fast instead of waiting 30 s
+ACTION_TIMEOUT_MS = 10_000
+NAVIGATION_TIMEOUT_MS = 15_000
+
+
+def _third_party_pattern(base_url: str) -> re.Pattern:
+    """
+    Match http(s) URLs on any host other than the app's own.
+
+    Third-party requests (ads, analytics, CDN widgets) are never asserted on.
+    Matching by URL rather than with a Python predicate keeps first-party
+    requests off the route handler entirely.
+    """
+    host = re.escape(urlsplit(base_url).hostname or "")
+    return re.compile(rf"^https?://(?!{host}(?:[:/]|$))", re.IGNORECASE)
+
+
+def _abort_route(route: Route) -> None:
+    route.abort()
+
+
+def _new_context(browser: Browser, browser_context_args: dict) -> BrowserContext:
+    """Create a context with the suite's timeouts."""
+    context = browser.new_context(**browser_context_args)
+    context.set_default_timeout(ACTION_TIMEOUT_MS)
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    return context
+
+
+# The contexts below are created here rather than by pytest-playwright's
+# ``context`` fixture, so they honour --tracing and --video the same way it does
+def _keep_artifact(request, mode: str) -> bool:
+    """Return whether a --tracing/--video mode keeps this test's artifact."""
+    if mode == "on":
+        return True
+    if mode != "retain-on-failure":
+        return False
+    report = request.node.stash.get(REPORT_KEYS["call"], None)
+    return report is None or report.failed
+
+
+def _start_tracing(request, context: BrowserContext) -> bool:
+    """Start tracing the context if --tracing is enabled; return whether it was."""
+    if request.config.getoption("--tracing") == "off":
+        return False
+    context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    return True
+
+
+def _trace_path(request, output_path: str) -> str | None:
+    """Return where to save this test's trace, or None to discard it."""
+    if _keep_artifact(request, request.config.getoption("--tracing")):
+        return os.path.join(output_path, "trace.zip")
+    return None
+
+
+def _close_page(request, page: Page, output_path: str | None = None) -> None:
+    """Close the page, then keep or delete its video according to --video."""
+    page.close()
+    if page.video is None:
+        return
+    if output_path and _keep_artifact(request, request.config.getoption("--video")):
+        page.video.save_as(os.path.join(output_path, "video.webm"))
+    page.video.delete()
+
+
+@pytest.fixture(scope="session")
+def the_internet_context(
+    request, browser: Browser, browser_context_args: dict, the_internet_config
+) -> Iterator[BrowserContext]:
+    """
+    Provide one browser context shared by every The Internet test.
+
+    Creating a context per test costs a few hundred milliseconds and throws
+    away the HTTP cache, so the context lives for the whole session (per
+    xdist worker) and only cookies, localStorage and the test's own pages are
+    reset between tests. Requests to third-party hosts are aborted; tests
+    that need every resource use ``needs_images``.
+
+    With --tracing enabled, tracing runs for the whole session and each test
+    records its own chunk (see ``trace_chunk``).
+    """
+    context = _new_context(browser, browser_context_args)
+    tracing = _start_tracing(request, context)
+    context.route(_third_party_pattern(the_internet_config.base_url), _abort_route)
+    # Keep a blank page open so the renderer is warm for the first test and
+    # for popups opened via expect_page()
+    warm_page = context.new_page()
+    warm_page.goto("about:blank")
+    yield context
+    _close_page(request, warm_page)
+    if tracing:
+        context.tracing.stop()
+    context.close()
+
+
+@pytest.fixture
+def trace_chunk(
+    request, the_internet_context: BrowserContext, output_path: str
+) -> Iterator[None]:
+    """
+    Record this test's part of the shared context's trace.
+
+    Saved to the test's output directory as ``trace.zip`` when --tracing keeps
+    it (always for ``on``, on failure for ``retain-on-failure``).
+    """
+    if request.config.getoption("--tracing") == "off":
+        yield
+        return
+    the_internet_context.tracing.start_chunk(title=request.node.nodeid)
+    yield
+    the_internet_context.tracing.stop_chunk(path=_trace_path(request, output_path))
+
+
+@pytest.fixture
+def page(
+    request, output_path: str, browser: Browser, browser_context_args: dict
+) -> Iterator[Page]:
+    """
+    Open a fresh page in the shared context and reset its state afterwards.
+
+    Tests marked ``@pytest.mark.needs_images`` get a page in a dedicated
+    context that loads every resource, and tests marked
+    ``@pytest.mark.isolated_context`` get one because they wait on
+    context-level events. Either way the test's trace and video are kept in
+    its output directory as --tracing/--video request.
+    """
+    node = request.node
+    if node.get_closest_marker("needs_images") or node.get_closest_marker("isolated_context"):
+        context = _new_context(browser, browser_context_args)
+        tracing = _start_tracing(request, context)
+        page = context.new_page()
+        yield page
+        if tracing:
+            context.tracing.stop(path=_trace_path(request, output_path))
+        _close_page(request, page, output_path)
+        context.close()
+        return
+
+    the_internet_context: BrowserContext = request.getfixturevalue("the_internet_context")
+    request.getfixturevalue("trace_chunk")
+    open_pages = set(the_internet_context.pages)
+    page = the_internet_context.new_page()
+    yield page
+    try:
+        # sessionStorage dies with the page; localStorage is per origin and
+        # would otherwise leak into the next test
+        page.evaluate("() => window.localStorage.clear()")
+    except Error:
+        pass  # page crashed or never left about:blank
+    for leftover in the_internet_context.pages:
+        if leftover is not page and leftover not in open_pages:
+            leftover.close()
+    _close_page(request, page, output_path)
+    the_internet_context.clear_cookies()
+
+
+@pytest.fixture(scope="session")
+def the_internet_auth_state(
+    browser: Browser, browser_context_args: dict, the_internet_config
+) -> dict:
+    """
+    Log in once per session over HTTP and return the resulting storage state.
+
+    The form is posted through the context's request API, so no page is
+    rendered; tests that only need an authenticated session reuse the cookies.
+    """
+    user = the_internet_config.test_users["default"]
+    context = _new_context(browser, browser_context_args)
+    response = context.request.post(
+        f"{the_internet_config.base_url}/authenticate",
+        form={"username": user["username"], "password": user["password"]},
+    )
+    if not response.url.endswith("/secure"):
+        pytest.fail(f"Could not log in as {user['username']}: ended at {response.url}")
+    state = context.storage_state()
+    context.close()
+    return state
+
+
+@pytest.fixture
+def authenticated_session(
+    the_internet_context: BrowserContext, the_internet_auth_state: dict, page: Page
+) -> None:
+    """
+    Load the session login cookies into the shared context for this test.
+
+    Depends on ``page`` so the cookies are cleared again by its teardown.
+    """
+    the_internet_context.add_cookies(the_internet_auth_state["cookies"])
+
+
+@pytest.fixture(scope="session")
+def upload_sample_file(tmp_path_factory) -> str:
+    """Write the file used by upload tests once per session."""
+    sample = tmp_path_factory.mktemp("upload") / "sample.txt"
+    sample.write_text("Test file content")
+    return str(sample)
+
+
+@pytest.fixture(scope="class")
+def alerts_ready(
+    request, the_internet_context: BrowserContext, the_internet_config
+) -> Iterator[JavaScriptAlertsPage]:
+    """
+    Open the JavaScript Alerts page once for a whole test class.
+
+    Each dialog test only clicks one button and reads #result, so the tests
+    reset the result text instead of reloading the page.
+    """
+    page = the_internet_context.new_page()
+    alerts_page = JavaScriptAlertsPage(page)
+    alerts_page.navigate_to_alerts(the_internet_config.base_url)
+    yield alerts_page
+    # The page spans the whole class, so it has no per-test video to keep
+    _close_page(request, page)
+
+
+@pytest.fixture
+def dialog_handler(page: Page):
+    """
+    Handle JavaScript dialogs raised inside a ``with`` block.
+
+    The listener is registered before the triggering click and removed on
+    exit, so no handler leaks into the next action on the page.
+
+    Usage:
+        with dialog_handler("accept"):
+            js_alerts_page.click_alert()
+        with dialog_handler("accept", "Hello"):
+            js_alerts_page.click_prompt()
+    """
+    @contextmanager
+    def _handle(action: str = "accept", text: str | None = None):
+        def _on_dialog(dialog: Dialog) -> None:
+            if action == "accept":
+                dialog.accept(text)
+            else:
+                dialog.dismiss()
+
+        page.on("dialog", _on_dialog)
+        try:
+            yield
+        finally:
+            page.remove_listener("dialog", _on_dialog)
+
+    return _handle
+
+
 @pytest.fixture
 def login_page(page: Page) -> LoginPage:
     return LoginPage(page)
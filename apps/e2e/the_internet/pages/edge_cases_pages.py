@@ -58,6 +58,16 @@ class ChallengingDOMPage(BasePage):
         """Get text from specific cell."""
         return self.table_rows.nth(row).locator('td').nth(col).inner_text()
 
+    def get_table_summary(self) -> dict:
+        """Get the row count and first cell text in a single evaluate call."""
+        return self.page.evaluate("""() => {
+            const rows = document.querySelectorAll('table tbody tr');
+            return {
+                row_count: rows.length,
+                first_cell: rows[0]?.cells[0]?.innerText ?? '',
+            };
+        }""")
+
 
 class InfiniteScrollPage(BasePage):
     """Page object for Infinite Scroll page."""
@@ -1,6 +1,6 @@
 """The Internet Interactions Pages."""
 
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page
 import allure
 from pages.base_page import BasePage
 
@@ -53,14 +53,17 @@ class HoverPage(BasePage):
         """Hover over user image by index."""
         self.user_images.nth(index).hover()
 
-    def is_user_info_visible(self, index: int) -> bool:
-        """Check if user info is visible for given index."""
-        user_info = self.user_images.nth(index).locator('.figcaption')
-        return user_info.is_visible()
+    def user_info(self, index: int) -> Locator:
+        """Get the hidden caption block for the user at index."""
+        return self.user_images.nth(index).locator('.figcaption')
+
+    def user_name(self, index: int) -> Locator:
+        """Get the user name heading for the user at index."""
+        return self.user_images.nth(index).locator('h5')
 
     def get_user_name(self, index: int) -> str:
         """Get user name text."""
-        return self.user_images.nth(index).locator('h5').inner_text()
+        return self.user_name(index).inner_text()
 
 
 class TablesPage(BasePage):
@@ -84,7 +87,12 @@ class TablesPage(BasePage):
         """Click on column header."""
         self.table.get_by_text(header_text, exact=True).click()
 
+    def snapshot_table(self) -> list[list[str]]:
+        """Read every body cell of the table in a single evaluate call."""
+        return self.table.evaluate(
+            "table => [...table.tBodies[0].rows].map(row => [...row.cells].map(cell => cell.innerText))"
+        )
+
     def get_column_values(self, column_index: int) -> list[str]:
         """Get all values from a specific column."""
-        cells = self.rows.locator(f'td:nth-child({column_index + 1})')
-        return [cell.inner_text() for cell in cells.all()]
+        return [row[column_index] for row in self.snapshot_table()]
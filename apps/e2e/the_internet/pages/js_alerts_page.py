@@ -20,7 +20,7 @@ class JavaScriptAlertsPage(BasePage):
     @allure.step("Navigate to JavaScript Alerts Page")
     def navigate_to_alerts(self, base_url: str):
         """Navigate to alerts page."""
-        self.navigate(f"{base_url}{self.URL_SUFFIX}")
+        self.navigate(f"{base_url}{self.URL_SUFFIX}", wait_until="domcontentloaded")
 
     @allure.step("Click alert button")
     def click_alert(self):
@@ -37,6 +37,10 @@ class JavaScriptAlertsPage(BasePage):
         """Click the prompt button."""
         self.prompt_button.click()
 
+    def reset_result(self):
+        """Clear the result text left by a previous dialog."""
+        self.result.evaluate("el => el.innerText = ''")
+
     def get_result_text(self) -> str:
         """Get result text."""
         return self.result.inner_text()
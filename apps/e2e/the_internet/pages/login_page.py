@@ -21,7 +21,7 @@ class LoginPage(BasePage):
     @allure.step("Navigate to Login Page")
     def navigate_to_login(self, base_url: str):
         """Navigate to login page."""
-        self.navigate(f"{base_url}{self.URL_SUFFIX}")
+        self.navigate(f"{base_url}{self.URL_SUFFIX}", wait_until="domcontentloaded")
 
     @allure.step("Login with {username}")
     def login(self, username: str, password: str):
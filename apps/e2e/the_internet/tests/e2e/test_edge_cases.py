@@ -45,6 +45,7 @@ Verify that broken images can be identified.
 Tests ability to detect and handle broken image assets.
 """,
 )
+@pytest.mark.needs_images
 def test_broken_images(broken_images_page, the_internet_config):
     """TC-TI-070: Identify broken images."""
 
@@ -106,13 +107,10 @@ def test_challenging_dom(challenging_dom_page, the_internet_config):
         challenging_dom_page.click_button(0)
         challenging_dom_page.click_button(1)
 
-    with allure.step("Verify table is accessible"):
-        row_count = challenging_dom_page.get_table_row_count()
-        assert row_count == 10
-
-    with allure.step("Verify cell data can be read"):
-        first_cell = challenging_dom_page.get_cell_text(0, 0)
-        assert first_cell
+    with allure.step("Verify table is accessible and cell data can be read"):
+        summary = challenging_dom_page.get_table_summary()
+        assert summary["row_count"] == 10
+        assert summary["first_cell"]
 
 
 @e2e_test(
@@ -144,8 +142,11 @@ Verify that infinite scroll loads new content.
 Tests common infinite scroll pattern in modern web apps.
 """,
 )
+@pytest.mark.slow
 def test_infinite_scroll(infinite_scroll_page, the_internet_config):
     """TC-TI-072: Infinite scroll loads new content."""
+    # Content is appended after scroll events; allow more than the suite default
+    infinite_scroll_page.page.set_default_timeout(20_000)
 
     with allure.step("Navigate to infinite scroll page"):
         infinite_scroll_page.navigate_to_page(the_internet_config.base_url)
@@ -108,6 +108,7 @@ def test_nested_frames(nested_frames_page, the_internet_config):
         assert "BOTTOM" in bottom_text
 
 
+@pytest.mark.isolated_context
 @e2e_test(
     epic="The Internet E2E",
     feature="Frames & Windows",
@@ -143,7 +144,7 @@ def test_multiple_windows(multiple_windows_page, the_internet_config, page):
         multiple_windows_page.navigate_to_page(the_internet_config.base_url)
 
     with allure.step("Open new window and capture reference"):
-        with page.context.expect_page() as new_page_info:
+        with page.context.expect_page(timeout=5000) as new_page_info:
             multiple_windows_page.open_new_window()
         new_page = new_page_info.value
 
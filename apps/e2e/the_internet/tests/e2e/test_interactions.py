@@ -52,15 +52,15 @@ def test_drag_and_drop(drag_drop_page, the_internet_config):
         drag_drop_page.navigate_to_page(the_internet_config.base_url)
 
     with allure.step("Verify initial state"):
-        assert drag_drop_page.get_column_a_text() == "A"
-        assert drag_drop_page.get_column_b_text() == "B"
+        expect(drag_drop_page.column_a).to_have_text("A")
+        expect(drag_drop_page.column_b).to_have_text("B")
 
     with allure.step("Drag A to B"):
         drag_drop_page.drag_a_to_b()
 
     with allure.step("Verify columns swapped"):
-        assert drag_drop_page.get_column_a_text() == "B"
-        assert drag_drop_page.get_column_b_text() == "A"
+        expect(drag_drop_page.column_a).to_have_text("B")
+        expect(drag_drop_page.column_b).to_have_text("A")
 
 
 @e2e_test(
@@ -92,21 +92,18 @@ Verify that hover reveals hidden user information.
 Tests hover-based UI patterns for contextual information.
 """,
 )
+@pytest.mark.needs_images
 def test_hover(hover_page, the_internet_config):
     """TC-TI-031: Hover to display hidden info."""
 
     with allure.step("Navigate to hover page"):
         hover_page.navigate_to_page(the_internet_config.base_url)
 
-    with allure.step("Hover over first user and verify info"):
-        hover_page.hover_user(0)
-        assert hover_page.is_user_info_visible(0)
-        assert "user1" in hover_page.get_user_name(0)
-
-    with allure.step("Hover over second user and verify different info"):
-        hover_page.hover_user(1)
-        assert hover_page.is_user_info_visible(1)
-        assert "user2" in hover_page.get_user_name(1)
+    for index, expected_name in enumerate(["user1", "user2"]):
+        with allure.step(f"Hover over user {index + 1} and verify info"):
+            hover_page.hover_user(index)
+            expect(hover_page.user_info(index)).to_be_visible()
+            expect(hover_page.user_name(index)).to_contain_text(expected_name)
 
 
 @e2e_test(
@@ -15,7 +15,6 @@ import pytest
 import allure
 from playwright.sync_api import expect
 from pathlib import Path
-import tempfile
 
 from infrastructure.utils.allure_helpers import e2e_test
 
@@ -34,7 +33,7 @@ from infrastructure.utils.allure_helpers import e2e_test
 Verify that files can be uploaded via web form.
 
 **Test Steps:**
-1. Create a temporary test file
+1. Use the session's sample upload file
 2. Navigate to file upload page
 3. Upload the file
 4. Verify filename appears on page
@@ -48,25 +47,19 @@ Verify that files can be uploaded via web form.
 Tests file upload capability for document/image handling.
 """,
 )
-def test_file_upload(file_upload_page, the_internet_config):
+def test_file_upload(file_upload_page, upload_sample_file, the_internet_config):
     """TC-TI-060: Upload a file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write("Test file content")
-        test_file_path = f.name
 
-    try:
-        with allure.step("Navigate to file upload page"):
-            file_upload_page.navigate_to_page(the_internet_config.base_url)
+    with allure.step("Navigate to file upload page"):
+        file_upload_page.navigate_to_page(the_internet_config.base_url)
 
-        with allure.step("Upload test file"):
-            file_upload_page.upload_file(test_file_path)
+    with allure.step("Upload test file"):
+        file_upload_page.upload_file(upload_sample_file)
 
-        with allure.step("Verify filename appears"):
-            filename = Path(test_file_path).name
-            uploaded = file_upload_page.get_uploaded_filename()
-            assert filename in uploaded
-    finally:
-        Path(test_file_path).unlink(missing_ok=True)
+    with allure.step("Verify filename appears"):
+        filename = Path(upload_sample_file).name
+        uploaded = file_upload_page.get_uploaded_filename()
+        assert filename in uploaded
 
 
 @e2e_test(
@@ -84,7 +77,7 @@ Verify that Basic HTTP authentication works.
 
 **Test Steps:**
 1. Get credentials from config
-2. Navigate with authentication
+2. Request the protected page with an Authorization header
 3. Verify success message appears
 
 **Test Coverage:**
@@ -103,12 +96,11 @@ def test_basic_auth(basic_auth_page, the_internet_config):
     username = the_internet_config.extra_config.get("basic_auth", {}).get("username", "admin")
     password = the_internet_config.extra_config.get("basic_auth", {}).get("password", "admin")
 
-    with allure.step(f"Navigate with auth credentials ({username})"):
-        basic_auth_page.navigate_with_auth(username, password)
+    with allure.step(f"Request protected page with auth credentials ({username})"):
+        body = basic_auth_page.fetch_with_auth(the_internet_config.base_url, username, password)
 
     with allure.step("Verify success message"):
-        message = basic_auth_page.get_message()
-        assert "Congratulations" in message
+        assert "Congratulations" in body
 
 
 @e2e_test(
@@ -125,7 +117,7 @@ def test_basic_auth(basic_auth_page, the_internet_config):
 Verify that logout functionality works.
 
 **Test Steps:**
-1. Login to the application
+1. Open the secure area with a pre-authenticated session
 2. Click logout button
 3. Verify redirect to login page
 4. Verify username input is visible
@@ -139,13 +131,11 @@ Verify that logout functionality works.
 Tests user session management and security.
 """,
 )
-def test_logout(login_page, secure_page, the_internet_config):
+def test_logout(authenticated_session, login_page, secure_page, the_internet_config):
     """TC-TI-004: Logout functionality."""
-    user = the_internet_config.test_users["default"]
 
-    with allure.step("Login first"):
-        login_page.navigate_to_login(the_internet_config.base_url)
-        login_page.login(user["username"], user["password"])
+    with allure.step("Open secure area as a logged-in user"):
+        secure_page.navigate_to_page(the_internet_config.base_url)
 
     with allure.step("Logout"):
         secure_page.logout()
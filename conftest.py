@@ -9,11 +9,9 @@ This module provides:
 - Environment information attachment for Allure reports
 """
 
-import json
+import functools
 import os
-import platform
 from datetime import datetime
-from pathlib import Path
 
 import allure
 import pytest
@@ -21,6 +19,7 @@ from playwright.sync_api import Playwright
 
 # Import fixtures from infrastructure
 from infrastructure.fixtures.session import (
+    ensure_results_dirs,
     environment,
     env_config,
     test_data,
@@ -32,14 +31,22 @@ from infrastructure.fixtures.session import (
 )
 from infrastructure.fixtures.app_factory import (
     app_configs,
+    app_instances,
     current_app,
+    get_app_name,
+)
+from infrastructure.fixtures.har_recording import (
+    har_recording,
+    har_recording_session,
 )
 # Import unified reporting hooks for enhanced Allure integration
 from infrastructure.hooks.unified_reporting import (
     pytest_runtest_makereport,
+    pytest_collection_finish,
     attach_screenshot,
     allure_step,
 )
+from infrastructure.utils.allure_helpers import set_allure_enabled
 
 
 def pytest_addoption(parser):
@@ -60,6 +67,11 @@ def pytest_addoption(parser):
         action="store_true",
         help="Run tests for all configured apps"
     )
+    parser.addoption(
+        "--attach-success-artifacts",
+        action="store_true",
+        help="Attach screenshots, videos and HAR files for passing E2E tests too"
+    )
 
 
 def pytest_configure(config):
@@ -91,43 +103,43 @@ def pytest_configure(config):
     )
 
     # Create test results directories
-    results_dir = Path("test-results")
-    results_dir.mkdir(exist_ok=True)
-    Path("allure-results").mkdir(exist_ok=True)  # Allure results in root
-    Path("allure-results/history").mkdir(exist_ok=True)  # History tracking
-    (results_dir / "screenshots").mkdir(exist_ok=True)
-    (results_dir / "traces").mkdir(exist_ok=True)
-    (results_dir / "videos").mkdir(exist_ok=True)
-    (results_dir / "allure-history").mkdir(exist_ok=True)  # Persistent history storage
+    ensure_results_dirs()
 
+    # Attachments are discarded without --alluredir, so skip building them
+    set_allure_enabled(bool(config.getoption("--alluredir", default=None)))
 
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(items, config):
     """
     Filter tests by app if --app specified.
 
     This enables running tests for specific apps only:
         pytest --app admin_portal --app customer_portal
+
+    Runs first so the cheap app filter shrinks the list before the
+    ``-k``/``-m`` expression matching and other plugins see it. Without a
+    filter no item is touched; fixtures and hooks look the app up lazily.
     """
     selected_apps = config.getoption("--app")
-    all_apps = config.getoption("--all-apps")
-
-    if all_apps or not selected_apps:
+    if not items or not selected_apps or config.getoption("--all-apps"):
         return  # No filtering requested
 
-    selected = []
+    selected_apps = set(selected_apps)
+    kept = 0
     deselected = []
 
     for item in items:
-        app_marker = item.get_closest_marker("app")
-        if app_marker and app_marker.args[0] in selected_apps:
-            selected.append(item)
-        elif not app_marker:
-            # Include tests without app marker (shared tests)
-            selected.append(item)
+        app_name = get_app_name(item)
+        if app_name is None or app_name in selected_apps:
+            # Tests without app marker (shared tests) are always included
+            items[kept] = item
+            kept += 1
         else:
             deselected.append(item)
 
-    items[:] = selected
+    # Kept items were compacted to the front of the list in place
+    del items[kept:]
 
     if deselected:
         config.hook.pytest_deselected(items=deselected)
@@ -189,6 +201,20 @@ def browser_type_launch_args(browser_type_launch_args, env_config):
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> dict[str, str]:
+    """Collect host platform details once per process; they never change."""
+    import platform
+
+    return {
+        "platform": platform.platform(),
+        "system": f"{platform.system()} {platform.release()}",
+        "processor": platform.processor(),
+        "python_implementation": platform.python_implementation(),
+        "hostname": platform.node(),
+    }
+
+
 @pytest.fixture(scope="session", autouse=True)
 def attach_run_information(request, run_id: str):
     """
@@ -201,7 +227,13 @@ def attach_run_information(request, run_id: str):
     - Run ID: Unique identifier for this test run
     - Run timestamp: When this run started
     - Environment: Which environment is being tested
+
+    Skipped when Allure results are not being written (no ``--alluredir``).
     """
+    if not request.config.getoption("--alluredir", default=None):
+        return
+
+    import json
     import sys
 
     run_info = {
@@ -210,7 +242,7 @@ def attach_run_information(request, run_id: str):
         "environment": request.config.getoption("--env", "dev"),
         "python_version": sys.version.split()[0],
         "pytest_version": pytest.__version__,
-        "platform": platform.platform(),
+        "platform": _platform_info()["platform"],
     }
 
     # Add run info as a JSON attachment
@@ -256,17 +288,19 @@ def attach_environment_information(request):
     - Reproducing failed tests accurately
     - Tracking flakiness across environments
     - Understanding test execution context
+
+    Skipped when Allure results are not being written (no ``--alluredir``).
     """
+    if not request.config.getoption("--alluredir", default=None):
+        return
+
+    import json
     import sys
 
     env_info = {
         "environment": request.config.getoption("--env", "dev"),
         "python_version": sys.version,
-        "platform": platform.platform(),
-        "system": f"{platform.system()} {platform.release()}",
-        "processor": platform.processor(),
-        "python_implementation": platform.python_implementation(),
-        "hostname": platform.node(),
+        **_platform_info(),
     }
 
     # Add pytest version
@@ -303,21 +337,22 @@ def attach_environment_information(request):
     )
 
     # Also attach as a human-readable table
-    env_table = "\n".join([
-        "## Environment Information",
-        "",
-        f"| Key | Value |",
-        f"|-----|-------|",
+    parallel = f"Yes ({worker_id})" if env_info["parallel_execution"] else "No"
+    rows = [
         f"| Environment | {env_info['environment']} |",
         f"| Python | {env_info['python_version'].split()[0]} |",
         f"| Platform | {env_info['platform']} |",
         f"| System | {env_info['system']} |",
         f"| Hostname | {env_info['hostname']} |",
         f"| Pytest | {env_info['pytest_version']} |",
-        f"| Parallel | {'Yes (' + worker_id + ')' if env_info['parallel_execution'] else 'No'} |",
-    ] + [
-        f"| CI | {env_info.get('ci_provider', 'N/A')} |",
-    ] if env_info.get("ci_environment") else [])
+        f"| Parallel | {parallel} |",
+    ]
+    if env_info.get("ci_environment"):
+        rows.append(f"| CI | {env_info['ci_provider']} |")
+    env_table = (
+        "## Environment Information\n\n| Key | Value |\n|-----|-------|\n"
+        + "\n".join(rows)
+    )
 
     allure.attach(
         env_table,
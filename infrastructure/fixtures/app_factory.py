@@ -8,13 +8,38 @@ from pathlib import Path
 from typing import Any
 
 import pytest
-import yaml
 from playwright.sync_api import Page
 
+from infrastructure.fixtures.session import CONFIG_DIR, load_yaml
 
-@dataclass
+# App name from each item's @pytest.mark.app, resolved once by get_app_name()
+APP_NAME_KEY = pytest.StashKey["str | None"]()
+
+
+def get_app_name(item: pytest.Item) -> str | None:
+    """
+    Return the app named by the item's @pytest.mark.app, or None.
+
+    The marker is looked up on first use and cached in the item's stash.
+    """
+    try:
+        return item.stash[APP_NAME_KEY]
+    except KeyError:
+        app_marker = item.get_closest_marker("app")
+        app_name = app_marker.args[0] if app_marker else None
+        item.stash[APP_NAME_KEY] = app_name
+        return app_name
+
+
+@dataclass(frozen=True, slots=True)
 class AppConfig:
-    """Configuration for a single web application."""
+    """
+    Configuration for a single web application.
+
+    Instances are loaded once per session and shared by every test through
+    session-scoped fixtures, so they are frozen to keep one test from
+    leaking changes into the next.
+    """
 
     name: str
     display_name: str
@@ -43,8 +68,7 @@ class AppConfig:
         if not config_path.exists():
             raise FileNotFoundError(f"App config not found: {config_path}")
 
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = load_yaml(config_path)
 
         # Get base URL for the current environment
         base_urls = config.get("base_urls", {})
@@ -92,6 +116,7 @@ class AppInstance:
         self.config = config
         self.page = page
         self._pages_module = None
+        self._user_cache: dict[str, dict[str, str]] = {}
 
     @property
     def name(self) -> str:
@@ -137,15 +162,21 @@ class AppInstance:
         Returns:
             Dictionary with username/email and password
         """
-        user_config = self.config.test_users.get(user_type, {})
-        password_env = user_config.get("password_env", "")
-
-        return {
-            "username": user_config.get("username", user_config.get("email", "")),
-            "email": user_config.get("email", user_config.get("username", "")),
-            "password": os.environ.get(password_env, ""),
-            "role": user_config.get("role", ""),
-        }
+        user = self._user_cache.get(user_type)
+        if user is None:
+            user_config = self.config.test_users.get(user_type, {})
+            password_env = user_config.get("password_env", "")
+
+            user = {
+                "username": user_config.get("username", user_config.get("email", "")),
+                "email": user_config.get("email", user_config.get("username", "")),
+                "password": os.environ.get(password_env, ""),
+                "role": user_config.get("role", ""),
+            }
+            self._user_cache[user_type] = user
+
+        # Copy so a test editing its credentials cannot affect later tests
+        return dict(user)
 
     def take_screenshot(self, name: str, full_page: bool = True) -> Path:
         """
@@ -167,21 +198,25 @@ class AppInstance:
         return screenshot_path
 
 
-def load_app_configs(environment: str) -> dict[str, AppConfig]:
+def load_app_configs(environment: str, only: set[str] | None = None) -> dict[str, AppConfig]:
     """
     Load all app configurations.
 
     Args:
         environment: Current environment (dev, staging, production)
+        only: If given, load only these apps (matched on the
+            ``<app>_config.yml`` file name) and skip reading the rest
 
     Returns:
         Dictionary mapping app names to AppConfig instances
     """
-    apps_config_dir = Path(__file__).parent.parent.parent / "config" / "apps"
+    apps_config_dir = CONFIG_DIR / "apps"
     configs = {}
 
     if apps_config_dir.exists():
         for config_file in apps_config_dir.glob("*_config.yml"):
+            if only and config_file.stem.removesuffix("_config") not in only:
+                continue
             try:
                 app_config = AppConfig.from_yaml(config_file, environment)
                 configs[app_config.name] = app_config
@@ -192,17 +227,37 @@ def load_app_configs(environment: str) -> dict[str, AppConfig]:
 
 
 @pytest.fixture(scope="session")
-def app_configs(environment: str) -> dict[str, AppConfig]:
+def app_configs(pytestconfig, environment: str) -> dict[str, AppConfig]:
     """
     Load all app configurations.
 
     This fixture loads app configurations from YAML files in config/apps/.
+    When the run is restricted with ``--app`` (and not ``--all-apps``),
+    only the selected apps' files are read.
     """
+    selected_apps = pytestconfig.getoption("--app")
+    if selected_apps and not pytestconfig.getoption("--all-apps"):
+        return load_app_configs(environment, only=set(selected_apps))
     return load_app_configs(environment)
 
 
+@pytest.fixture(scope="session")
+def app_instances() -> dict[str, AppInstance]:
+    """
+    Cache of AppInstance objects keyed by app name.
+
+    ``current_app`` reuses these and only rebinds the page for each test.
+    """
+    return {}
+
+
 @pytest.fixture
-def current_app(request, app_configs: dict[str, AppConfig], page: Page) -> AppInstance:
+def current_app(
+    request,
+    app_configs: dict[str, AppConfig],
+    app_instances: dict[str, AppInstance],
+    page: Page,
+) -> AppInstance:
     """
     Get the app instance for the current test.
 
@@ -215,20 +270,23 @@ def current_app(request, app_configs: dict[str, AppConfig], page: Page) -> AppIn
     Raises:
         pytest.fail: If test doesn't have @pytest.mark.app marker or app not found
     """
-    marker = request.node.get_closest_marker("app")
+    app_name = get_app_name(request.node)
 
-    if not marker:
+    if app_name is None:
         pytest.fail(
             "Test must specify @pytest.mark.app('app_name'). "
             f"Available apps: {list(app_configs.keys())}"
         )
 
-    app_name = marker.args[0]
-
     if app_name not in app_configs:
         pytest.fail(
             f"Unknown app: {app_name}. Available apps: {list(app_configs.keys())}"
         )
 
-    config = app_configs[app_name]
-    return AppInstance(config, page)
+    instance = app_instances.get(app_name)
+    if instance is None:
+        instance = AppInstance(app_configs[app_name], page)
+        app_instances[app_name] = instance
+    else:
+        instance.page = page
+    return instance
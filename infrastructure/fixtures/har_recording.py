@@ -10,7 +10,17 @@ import os
 from pathlib import Path
 
 import pytest
-from playwright.sync_api import BrowserContext
+from playwright.sync_api import Browser, BrowserContext
+
+# HAR recording is opt-in via environment variable to avoid large file sizes;
+# read once at import since it cannot change during a session
+_HAR_ENABLED = os.getenv("PLAYWRIGHT_HAR", "false").lower() in {"true", "1", "on"}
+
+# PLAYWRIGHT_HAR_SCOPE=session records one HAR for the whole session instead
+_HAR_SESSION_SCOPE = os.getenv("PLAYWRIGHT_HAR_SCOPE", "test").lower() == "session"
+
+# Path separators in test names, mapped to "_" in one pass
+_PATH_SEPARATORS = str.maketrans({"/": "_", "\\": "_"})
 
 
 @pytest.fixture(scope="function")
@@ -33,22 +43,18 @@ def har_recording(context: BrowserContext, request):
         context: Playwright browser context
         request: pytest request object for test metadata
     """
+    if not _HAR_ENABLED or _HAR_SESSION_SCOPE:
+        yield False  # HAR recording disabled, or recorded per session instead
+        return
+
     # Get test output path from pytest-playwright
     # The plugin creates a unique directory for each test
-    test_name = request.node.name.replace("/", "_").replace("\\", "_")
+    test_name = request.node.name.translate(_PATH_SEPARATORS)
     output_dir = Path("test-results") / test_name
     output_dir.mkdir(parents=True, exist_ok=True)
 
     har_path = output_dir / "network.har"
 
-    # Check if HAR recording is enabled via environment variable
-    # This allows selective HAR recording to avoid large file sizes
-    enable_har = os.getenv("PLAYWRIGHT_HAR", "false").lower() in ("true", "1", "on")
-
-    if not enable_har:
-        yield False  # HAR recording disabled
-        return
-
     # Start HAR recording
     # Playwright 1.17+ supports context.record_har()
     try:
@@ -67,3 +73,45 @@ def har_recording(context: BrowserContext, request):
         except (AttributeError, Exception):
             # May fail if recording wasn't started or already stopped
             pass
+
+
+@pytest.fixture(scope="session")
+def har_recording_session(browser: Browser, browser_context_args: dict):
+    """
+    Record a single HAR file for every test that shares this context.
+
+    Starting and stopping a recording per test is costly when many tests
+    run against the same app; this variant opens one recording context for
+    the session and writes ``test-results/session.har`` when it closes.
+    Keep using ``har_recording`` when per-test isolation matters.
+
+    Enabled with ``PLAYWRIGHT_HAR=true PLAYWRIGHT_HAR_SCOPE=session``.
+
+    Usage:
+        def test_with_session_har(har_recording_session):
+            if har_recording_session is None:
+                pytest.skip("Session HAR recording disabled")
+            page = har_recording_session.new_page()
+            page.goto("https://example.com")
+
+    Args:
+        browser: Playwright browser instance
+        browser_context_args: Context options from pytest-playwright
+
+    Yields:
+        The recording browser context, or None when disabled
+    """
+    if not (_HAR_ENABLED and _HAR_SESSION_SCOPE):
+        yield None
+        return
+
+    har_path = Path("test-results") / "session.har"
+    har_path.parent.mkdir(parents=True, exist_ok=True)
+
+    context = browser.new_context(
+        **browser_context_args,
+        record_har_path=str(har_path),
+    )
+    yield context
+    # The HAR file is written when the context closes
+    context.close()
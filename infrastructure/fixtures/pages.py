@@ -1,11 +1,20 @@
-"""Page object fixtures factory."""
+"""Page object fixtures factory.
+
+Page object modules are imported inside each fixture, so sessions that
+never request them (e.g. API-only runs) do not import them.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 import pytest
 from playwright.sync_api import Page
 
-from pages.base_page import BasePage
-from pages.login_page import LoginPage
-from pages.dashboard_page import DashboardPage
+if TYPE_CHECKING:
+    from pages.base_page import BasePage
+    from pages.dashboard_page import DashboardPage
+    from pages.login_page import LoginPage
 
 
 @pytest.fixture
@@ -15,6 +24,8 @@ def base_page(page: Page) -> BasePage:
 
     This is a generic page object for common operations.
     """
+    from pages.base_page import BasePage
+
     return BasePage(page)
 
 
@@ -25,6 +36,8 @@ def login_page(page: Page) -> LoginPage:
 
     Use for tests that need to interact with login functionality.
     """
+    from pages.login_page import LoginPage
+
     return LoginPage(page)
 
 
@@ -35,4 +48,6 @@ def dashboard_page(page: Page) -> DashboardPage:
 
     Use for tests that need to interact with dashboard functionality.
     """
+    from pages.dashboard_page import DashboardPage
+
     return DashboardPage(page)
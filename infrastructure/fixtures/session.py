@@ -11,8 +11,63 @@ import pytest
 import yaml
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+from infrastructure.utils.data_loader import CONFIG_DIR, YamlLoader
+
+# Load environment variables from .env file. xdist workers are spawned by
+# the controller after it imported this module, so they inherit the loaded
+# variables and skip re-reading the file.
+if "PYTEST_XDIST_WORKER" not in os.environ:
+    load_dotenv()
+
+RESULTS_DIR = Path("test-results")
+
+# Output directories created once per process by ensure_results_dirs()
+_RESULTS_DIRS = (
+    RESULTS_DIR / "screenshots",
+    RESULTS_DIR / "traces",
+    RESULTS_DIR / "videos",
+    RESULTS_DIR / "allure-history",  # Persistent history storage
+    Path("allure-results/history"),  # Allure results in root, with history tracking
+)
+_DIRS_READY = False
+
+
+def ensure_results_dirs() -> None:
+    """
+    Create the test output directories.
+
+    Idempotent and safe to call concurrently from xdist workers; after the
+    first call in a process it does no filesystem work at all.
+    """
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for directory in _RESULTS_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+    _DIRS_READY = True
+
+
+# Parsed YAML documents keyed by (path, mtime_ns)
+_YAML_CACHE: dict[tuple[str, int], Any] = {}
+
+
+def load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    The cached object is shared between callers and must not be mutated.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content
+    """
+    key = (str(path), path.stat().st_mtime_ns)
+    if key not in _YAML_CACHE:
+        with open(path) as f:
+            _YAML_CACHE[key] = yaml.load(f, Loader=YamlLoader)
+    return _YAML_CACHE[key]
 
 
 def load_env_config(env: str = "dev") -> dict[str, Any]:
@@ -25,15 +80,14 @@ def load_env_config(env: str = "dev") -> dict[str, Any]:
     Returns:
         Dictionary containing environment configuration
     """
-    config_path = Path(__file__).parent.parent.parent / "config" / "environments.yml"
+    config_path = CONFIG_DIR / "environments.yml"
 
     if not config_path.exists():
         raise FileNotFoundError(f"Environment config not found: {config_path}")
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = load_yaml(config_path)
 
-    env_config = config.get("environments", {}).get(env, {})
+    env_config = dict(config.get("environments", {}).get(env, {}))
     env_config["name"] = env
     env_config["browsers"] = config.get("browsers", {})
     env_config["viewports"] = config.get("viewports", {})
@@ -48,13 +102,12 @@ def load_test_data() -> dict[str, Any]:
     Returns:
         Dictionary containing test data
     """
-    config_path = Path(__file__).parent.parent.parent / "config" / "test_data.yml"
+    config_path = CONFIG_DIR / "test_data.yml"
 
     if not config_path.exists():
         return {}
 
-    with open(config_path) as f:
-        return yaml.safe_load(f) or {}
+    return load_yaml(config_path) or {}
 
 
 @pytest.fixture(scope="session")
@@ -88,47 +141,42 @@ def test_results_dir() -> Path:
     """
     Provide path to test results directory.
 
-    Creates the directory if it doesn't exist.
+    Created here rather than only in pytest_configure, because
+    pytest-playwright removes its output directory (test-results/) at the
+    start of the session.
     """
-    results_dir = Path("test-results")
-    results_dir.mkdir(exist_ok=True)
-    return results_dir
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    return RESULTS_DIR
 
 
 @pytest.fixture(scope="session")
 def screenshots_dir(test_results_dir: Path) -> Path:
     """
-    Provide path to screenshots directory.
-
-    Creates the directory if it doesn't exist.
+    Provide path to screenshots directory, creating it if needed.
     """
-    screenshots = test_results_dir / "screenshots"
-    screenshots.mkdir(exist_ok=True)
-    return screenshots
+    directory = test_results_dir / "screenshots"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
 
 
 @pytest.fixture(scope="session")
 def traces_dir(test_results_dir: Path) -> Path:
     """
-    Provide path to traces directory.
-
-    Creates the directory if it doesn't exist.
+    Provide path to traces directory, creating it if needed.
     """
-    traces = test_results_dir / "traces"
-    traces.mkdir(exist_ok=True)
-    return traces
+    directory = test_results_dir / "traces"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
 
 
 @pytest.fixture(scope="session")
 def videos_dir(test_results_dir: Path) -> Path:
     """
-    Provide path to videos directory.
-
-    Creates the directory if it doesn't exist.
+    Provide path to videos directory, creating it if needed.
     """
-    videos = test_results_dir / "videos"
-    videos.mkdir(exist_ok=True)
-    return videos
+    directory = test_results_dir / "videos"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
 
 
 def get_env_variable(name: str, default: str | None = None) -> str | None:
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
+import os
 import re
-from datetime import datetime
+import shutil
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -12,7 +17,32 @@ import allure
 import pytest
 from playwright.sync_api import Page
 
-from infrastructure.utils.allure_helpers import markdown_to_html
+try:
+    import ijson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    orjson = None
+
+from infrastructure.fixtures.app_factory import get_app_name
+from infrastructure.utils.allure_helpers import (
+    dumps_json,
+    markdown_to_html,
+    render_deferred_descriptions,
+)
+
+
+def pytest_collection_finish(session):
+    """
+    Render markdown test descriptions once collection is done.
+
+    Skipped entirely when Allure results are not being written.
+    """
+    if session.config.getoption("--alluredir", default=None):
+        render_deferred_descriptions(session.items)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -30,31 +60,111 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
 
-    # Store report for pytest native access
+    # Store report for access from fixtures: item.stash[REPORT_KEYS["call"]].
+    # The rep_setup/rep_call/rep_teardown attributes are kept for existing
+    # fixtures and plugins that read them (e.g. getattr(node, "rep_call"))
+    item.stash[REPORT_KEYS[report.when]] = report
     setattr(item, f"rep_{report.when}", report)
 
-    # Only process call phase (actual test execution)
-    if report.when != "call":
+    # Only process call phase (actual test execution); skipped and xfailed
+    # tests have nothing to attach
+    if report.when != "call" or report.skipped:
         return
 
     # Extract test metadata
-    app_marker = item.get_closest_marker("app")
-    app_name = app_marker.args[0] if app_marker else "unknown"
+    app_name = get_app_name(item) or "unknown"
+    markers = _get_markers(item)
+    page: Page | None = item.funcargs.get("page")
 
     # Attach artifacts on failure or success
     if report.failed:
-        _attach_failure_artifacts(item, report, app_name)
+        _attach_failure_artifacts(item, report, app_name, page, markers)
         # Categorize the failure for better triage
         _categorize_failure(item, report)
-    elif report.passed:
-        # Attach success screenshots for E2E tests only
-        _attach_success_artifacts(item, report, app_name)
+    elif report.passed and item.config.getoption("--attach-success-artifacts"):
+        # Attach success screenshots for E2E tests only (opt-in)
+        _attach_success_artifacts(item, app_name, page, markers)
 
     # Always attach metadata
-    _attach_test_metadata(item, app_name)
+    _attach_test_metadata(item, app_name, markers)
+
+
+# Marker data from _collect_markers, cached per item
+_MARKERS_KEY = pytest.StashKey[dict[str, Any]]()
+
 
+def _get_markers(item) -> dict[str, Any]:
+    """Return the item's reporting marker data, collecting it on first use."""
+    markers = item.stash.get(_MARKERS_KEY, None)
+    if markers is None:
+        markers = item.stash[_MARKERS_KEY] = _collect_markers(item)
+    return markers
 
-def _attach_failure_artifacts(item, report, app_name: str) -> None:
+
+def _collect_markers(item) -> dict[str, Any]:
+    """
+    Gather the marker data used for reporting in one walk over the markers.
+
+    Markers are visited closest first, so the first ``testcase`` seen is the
+    one ``get_closest_marker`` would return.
+
+    Args:
+        item: pytest test item
+
+    Returns:
+        Dictionary with ``e2e``, ``flaky``, ``full_page``, ``testcase``,
+        ``requirements`` and ``custom_tags``
+    """
+    markers: dict[str, Any] = {
+        "e2e": False,
+        "flaky": False,
+        "full_page": False,
+        "testcase": None,
+        "requirements": [],
+        "custom_tags": [],
+    }
+    for mark in item.iter_markers():
+        name = mark.name
+        if name == "e2e":
+            markers["e2e"] = True
+        elif name == "fullpage_screenshot":
+            markers["full_page"] = True
+        elif name == "flaky":
+            markers["flaky"] = True
+        elif name == "testcase":
+            if markers["testcase"] is None and mark.args:
+                markers["testcase"] = mark.args[0]
+        elif name == "requirement":
+            markers["requirements"].extend(mark.args)
+        elif name not in _BUILT_IN_MARKERS:
+            markers["custom_tags"].append(name)
+    return markers
+
+
+# Per-phase test reports stored on each item by pytest_runtest_makereport
+REPORT_KEYS: dict[str, pytest.StashKey[pytest.TestReport]] = {
+    "setup": pytest.StashKey[pytest.TestReport](),
+    "call": pytest.StashKey[pytest.TestReport](),
+    "teardown": pytest.StashKey[pytest.TestReport](),
+}
+
+
+# Last (epoch second, formatted timestamp) pair returned by _timestamp()
+_TIMESTAMP_CACHE: tuple[int, str] = (0, "")
+
+
+def _timestamp() -> str:
+    """Return the artifact timestamp, formatting it at most once per second."""
+    global _TIMESTAMP_CACHE
+    now = int(time.time())
+    if now != _TIMESTAMP_CACHE[0]:
+        _TIMESTAMP_CACHE = (now, time.strftime("%Y%m%d_%H%M%S", time.localtime(now)))
+    return _TIMESTAMP_CACHE[1]
+
+
+def _attach_failure_artifacts(
+    item, report, app_name: str, page: Page | None, markers: dict[str, Any]
+) -> None:
     """
     Attach screenshots, traces, and videos to Allure on failure.
 
@@ -62,9 +172,10 @@ def _attach_failure_artifacts(item, report, app_name: str) -> None:
         item: pytest test item
         report: Test report
         app_name: Name of the app being tested
+        page: The test's Playwright page, if it used one
+        markers: Marker data from _collect_markers
     """
     # Skip if no page object (e.g., API tests)
-    page: Page | None = item.funcargs.get("page")
     if not page:
         # For API tests, just attach error details
         if report.longrepr:
@@ -76,19 +187,20 @@ def _attach_failure_artifacts(item, report, app_name: str) -> None:
         return
 
     test_name = _sanitize_filename(item.name)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _timestamp()
+    outputs = _scan_output_path(item)
 
     # 1. Screenshot
-    _attach_screenshot(page, app_name, test_name, timestamp)
+    _attach_screenshot(page, app_name, test_name, timestamp, full_page=markers["full_page"])
 
     # 2. Playwright Trace (if available)
-    _attach_trace(item, app_name, test_name, timestamp)
+    _attach_trace(outputs["trace"], app_name, test_name, timestamp)
 
     # 3. Video Recording (if available)
-    _attach_video(item, app_name, test_name, timestamp, success=False)
+    _attach_video(outputs["video"], app_name, test_name, timestamp, success=False)
 
     # 4. HAR File (if available)
-    _attach_har(item, app_name, test_name, timestamp)
+    _attach_har(outputs["har"], app_name, test_name, timestamp)
 
     # 5. Error message
     if report.longrepr:
@@ -99,7 +211,9 @@ def _attach_failure_artifacts(item, report, app_name: str) -> None:
         )
 
 
-def _attach_success_artifacts(item, report, app_name: str) -> None:
+def _attach_success_artifacts(
+    item, app_name: str, page: Page | None, markers: dict[str, Any]
+) -> None:
     """
     Attach screenshots to Allure on successful E2E test completion.
 
@@ -110,45 +224,97 @@ def _attach_success_artifacts(item, report, app_name: str) -> None:
 
     Args:
         item: pytest test item
-        report: Test report
         app_name: Name of the app being tested
+        page: The test's Playwright page, if it used one
+        markers: Marker data from _collect_markers
     """
     # Only for E2E tests (have page object and e2e marker)
-    page: Page | None = item.funcargs.get("page")
-    if not page:
-        return
-
-    # Check if this is an E2E test
-    e2e_marker = item.get_closest_marker("e2e")
-    if not e2e_marker:
+    if not page or not markers["e2e"]:
         return
 
     test_name = _sanitize_filename(item.name)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = _timestamp()
+    outputs = _scan_output_path(item)
 
     # Attach final state screenshot
-    _attach_screenshot(page, app_name, test_name, timestamp, success=True)
+    _attach_screenshot(
+        page, app_name, test_name, timestamp, success=True, full_page=markers["full_page"]
+    )
 
     # Attach video recording for E2E tests
-    _attach_video(item, app_name, test_name, timestamp, success=True)
+    _attach_video(outputs["video"], app_name, test_name, timestamp, success=True)
 
     # Attach HAR file for E2E tests
-    _attach_har(item, app_name, test_name, timestamp)
+    _attach_har(outputs["har"], app_name, test_name, timestamp)
+
+
+def _scan_output_path(item) -> dict[str, list[Path]]:
+    """
+    List the trace, video and HAR files in the test's output directory.
+
+    Reads the directory once instead of globbing it per artifact type.
+
+    Args:
+        item: pytest test item
+
+    Returns:
+        Dictionary with ``trace``, ``video`` and ``har`` file lists
+    """
+    outputs: dict[str, list[Path]] = {"trace": [], "video": [], "har": []}
+    if "output_path" not in item.funcargs:
+        return outputs
+
+    try:
+        with os.scandir(item.funcargs["output_path"]) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("trace") and name.endswith(".zip"):
+                    outputs["trace"].append(Path(entry.path))
+                elif name.startswith("video") and name.endswith(".webm"):
+                    outputs["video"].append(Path(entry.path))
+                elif name.endswith(".har"):
+                    outputs["har"].append(Path(entry.path))
+    except OSError:
+        pass  # Output directory not created (nothing recorded)
+    return outputs
+
+
+def _ensure_dir(directory: Path) -> None:
+    """
+    Create an artifact directory if it does not exist.
+
+    Not cached: another xdist worker's pytest-playwright may remove
+    test-results/ after this worker first created it.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+
 
+def _attach_screenshot(
+    page: Page,
+    app_name: str,
+    test_name: str,
+    timestamp: str,
+    success: bool = False,
+    full_page: bool = False,
+) -> None:
+    """
+    Attach screenshot to Allure report.
 
-def _attach_screenshot(page: Page, app_name: str, test_name: str, timestamp: str, success: bool = False) -> None:
-    """Attach screenshot to Allure report."""
+    Captures the viewport unless the test is marked ``fullpage_screenshot``.
+    """
     screenshot_dir = Path("test-results/screenshots") / app_name
-    screenshot_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(screenshot_dir)
 
     # Different naming for success vs failure screenshots
     suffix = "success" if success else "failure"
-    screenshot_path = screenshot_dir / f"{test_name}_{timestamp}_{suffix}.png"
 
     try:
-        page.screenshot(path=str(screenshot_path), full_page=True)
-        allure.attach.file(
-            str(screenshot_path),
+        # page.screenshot() returns the image it saves, so attach those bytes
+        # instead of reading the file back from disk
+        screenshot_path = screenshot_dir / f"{test_name}_{timestamp}_{suffix}.png"
+        image = page.screenshot(path=str(screenshot_path), full_page=full_page)
+        allure.attach(
+            image,
             name="✅ Success Screenshot" if success else "Failure Screenshot",
             attachment_type=allure.attachment_type.PNG
         )
@@ -160,70 +326,111 @@ def _attach_screenshot(page: Page, app_name: str, test_name: str, timestamp: str
         )
 
 
-def _attach_trace(item, app_name: str, test_name: str, timestamp: str) -> None:
-    """Attach Playwright trace to Allure report."""
-    trace_dir = Path("test-results/traces") / app_name
-    trace_dir.mkdir(parents=True, exist_ok=True)
+def _attach_trace(trace_files: list[Path], app_name: str, test_name: str, timestamp: str) -> None:
+    """Attach Playwright trace (from the test's output directory) to Allure report."""
+    if not trace_files:
+        return
+
+    trace_path = trace_files[0]
+
+    try:
+        organized_trace = _organize_artifact(
+            trace_path,
+            Path("test-results/traces") / app_name,
+            f"{test_name}_{timestamp}_trace.zip",
+        )
+
+        allure.attach.file(
+            str(organized_trace),
+            name="Playwright Trace (open with: npx playwright show-trace)",
+            attachment_type=allure.attachment_type.ZIP
+        )
+    except Exception as e:
+        allure.attach(
+            f"Failed to attach trace: {e}",
+            name="Trace Error",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+
+# Artifacts already written below this directory are attached in place
+_RESULTS_ROOT = Path("test-results").resolve()
+
+
+def _organize_artifact(source: Path, directory: Path, filename: str) -> Path:
+    """
+    Return the path to attach for an artifact, moving it under ``directory`` if needed.
+
+    pytest-playwright writes into test-results/ by default; those files are
+    already kept with the run's results, so they are attached where they are.
+
+    Args:
+        source: Artifact found in the test's output directory
+        directory: Organized directory for artifacts from elsewhere
+        filename: File name to use in ``directory``
 
-    # Find trace file from output_path fixture
-    if "output_path" in item.funcargs:
-        output_path = Path(item.funcargs["output_path"])
-        trace_files = list(output_path.glob("trace*.zip"))
+    Returns:
+        Path of the file to attach
+    """
+    if source.resolve().is_relative_to(_RESULTS_ROOT):
+        return source
+    _ensure_dir(directory)
+    destination = directory / filename
+    _move_artifact(source, destination)
+    return destination
+
+
+def _move_artifact(source: Path, destination: Path) -> None:
+    """
+    Move an artifact out of the per-test output directory.
+
+    A rename within one filesystem moves no data, which matters for large
+    traces and videos; falls back to copying across devices.
+    """
+    try:
+        os.replace(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
 
-        if trace_files:
-            trace_path = trace_files[0]
-            organized_trace = trace_dir / f"{test_name}_{timestamp}_trace.zip"
 
-            try:
-                # Copy to organized location
-                import shutil
-                shutil.copy2(trace_path, organized_trace)
+def _link_artifact(source: Path, destination: Path) -> None:
+    """
+    Place a copy of an artifact while leaving the source in place.
 
-                allure.attach.file(
-                    str(organized_trace),
-                    name="Playwright Trace (open with: npx playwright show-trace)",
-                    attachment_type=allure.attachment_type.ZIP
-                )
-            except Exception as e:
-                allure.attach(
-                    f"Failed to attach trace: {e}",
-                    name="Trace Error",
-                    attachment_type=allure.attachment_type.TEXT
-                )
+    Hard-links within one filesystem so no data is copied; otherwise copies
+    the contents only (report artifacts do not need the original metadata).
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
 
 
-def _attach_video(item, app_name: str, test_name: str, timestamp: str, success: bool = False) -> None:
+def _attach_video(
+    video_files: list[Path], app_name: str, test_name: str, timestamp: str, success: bool = False
+) -> None:
     """
     Attach video recording to Allure report.
 
     Args:
-        item: pytest test item
+        video_files: Videos found in the test's output directory
         app_name: Name of the app being tested
         test_name: Sanitized test name
         timestamp: Timestamp string
         success: Whether test passed (affects attachment naming)
     """
-    # Find video file from output_path fixture
-    if "output_path" not in item.funcargs:
-        return
-
-    output_path = Path(item.funcargs["output_path"])
-    video_files = list(output_path.glob("video*.webm"))
-
     if not video_files:
         return
 
     video_path = video_files[0]
-    video_dir = Path("test-results/videos") / app_name
-    video_dir.mkdir(parents=True, exist_ok=True)
-
     suffix = "success" if success else "failure"
-    organized_video = video_dir / f"{test_name}_{timestamp}_{suffix}.webm"
 
     try:
-        # Copy to organized location
-        import shutil
-        shutil.copy2(video_path, organized_video)
+        organized_video = _organize_artifact(
+            video_path,
+            Path("test-results/videos") / app_name,
+            f"{test_name}_{timestamp}_{suffix}.webm",
+        )
 
         allure.attach.file(
             str(organized_video),
@@ -238,7 +445,32 @@ def _attach_video(item, app_name: str, test_name: str, timestamp: str, success:
         )
 
 
-def _attach_har(item, app_name: str, test_name: str, timestamp: str) -> None:
+# (mtime_ns, {name: path}) listing of test-results subdirectories
+_SUBDIR_INDEX: tuple[int, dict[str, Path]] | None = None
+
+
+def _results_subdirs() -> dict[str, Path]:
+    """
+    Return the subdirectories of test-results by name.
+
+    The listing is reused until the directory's mtime changes (a
+    subdirectory was added or removed), so repeated HAR lookups do not
+    rescan and stat every entry.
+    """
+    global _SUBDIR_INDEX
+    base = Path("test-results")
+    try:
+        mtime = base.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _SUBDIR_INDEX is None or _SUBDIR_INDEX[0] != mtime:
+        with os.scandir(base) as entries:
+            subdirs = {e.name: Path(e.path) for e in entries if e.is_dir()}
+        _SUBDIR_INDEX = (mtime, subdirs)
+    return _SUBDIR_INDEX[1]
+
+
+def _attach_har(har_files: list[Path], app_name: str, test_name: str, timestamp: str) -> None:
     """
     Attach HAR (HTTP Archive) file to Allure report.
 
@@ -248,18 +480,13 @@ def _attach_har(item, app_name: str, test_name: str, timestamp: str) -> None:
     - Request and response bodies
 
     Args:
-        item: pytest test item
+        har_files: HAR files found in the test's output directory
         app_name: Name of the app being tested
         test_name: Sanitized test name
         timestamp: Timestamp string
     """
-    # Search for HAR files in multiple locations
-    har_files = []
-
-    # 1. Check output_path fixture (pytest-playwright)
-    if "output_path" in item.funcargs:
-        output_path = Path(item.funcargs["output_path"])
-        har_files = list(output_path.glob("*.har"))
+    # Search for HAR files in multiple locations:
+    # 1. output_path fixture (pytest-playwright), already scanned by the caller
 
     # 2. Check test-results/{test_name}/ directory
     if not har_files:
@@ -270,31 +497,33 @@ def _attach_har(item, app_name: str, test_name: str, timestamp: str) -> None:
     # 3. Check pytest-playwright's default test-results location
     if not har_files:
         # pytest-playwright creates subdirectories per test
-        test_results_base = Path("test-results")
-        if test_results_base.exists():
-            # Search in subdirectories that match the test name
-            for subdir in test_results_base.iterdir():
-                if subdir.is_dir() and test_name in subdir.name:
-                    har_files = list(subdir.glob("*.har"))
-                    if har_files:
-                        break
+        for name, subdir in _results_subdirs().items():
+            if test_name in name:
+                har_files = list(subdir.glob("*.har"))
+                if har_files:
+                    break
 
     if not har_files:
         return
 
     har_path = har_files[0]
     har_dir = Path("test-results/hars") / app_name
-    har_dir.mkdir(parents=True, exist_ok=True)
 
     organized_har = har_dir / f"{test_name}_{timestamp}.har"
 
     try:
+        # Skip empty HARs and ones identical to a recently attached HAR
+        size = har_path.stat().st_size
+        if not _is_new_har(har_path, size):
+            return
+
+        _ensure_dir(har_dir)
+
         # Copy to organized location
-        import shutil
-        shutil.copy2(har_path, organized_har)
+        _link_artifact(har_path, organized_har)
 
-        # Get file size for reporting
-        file_size_mb = organized_har.stat().st_size / (1024 * 1024)
+        # Same size as the source, no need to stat the copy
+        file_size_mb = size / (1024 * 1024)
 
         allure.attach.file(
             str(organized_har),
@@ -313,6 +542,65 @@ def _attach_har(item, app_name: str, test_name: str, timestamp: str) -> None:
         )
 
 
+# Fingerprints of recently attached HAR files (bounded, oldest evicted first)
+_RECENT_HARS: OrderedDict[bytes, None] = OrderedDict()
+_RECENT_HARS_MAX = 128
+
+
+def _is_new_har(har_path: Path, size: int) -> bool:
+    """
+    Check whether a HAR file is worth attaching.
+
+    Empty files are rejected. Otherwise the file is fingerprinted by its
+    size and a hash of its first 64 KB, and rejected if the same fingerprint
+    was attached recently (e.g. a session-wide HAR or an identical retry).
+
+    Args:
+        har_path: Path to the HAR file
+        size: Size of the HAR file in bytes
+
+    Returns:
+        True if the HAR should be attached
+    """
+    if not size:
+        return False
+    with open(har_path, "rb") as f:
+        digest = hashlib.blake2b(f.read(65536), digest_size=16).digest()
+    fingerprint = digest + size.to_bytes(8, "big")
+    if fingerprint in _RECENT_HARS:
+        _RECENT_HARS.move_to_end(fingerprint)
+        return False
+    _RECENT_HARS[fingerprint] = None
+    if len(_RECENT_HARS) > _RECENT_HARS_MAX:
+        _RECENT_HARS.popitem(last=False)
+    return True
+
+
+_HAR_TIMING_KEYS = ("blocked", "dns", "connect", "send", "wait", "receive")
+
+
+def _iter_har_entries(har_path: Path):
+    """
+    Yield the entries of a HAR file.
+
+    Streams entries one at a time with ijson when it is installed, so large
+    HAR files are never fully loaded; otherwise parses the raw bytes with
+    orjson, or with json as a last resort.
+
+    Args:
+        har_path: Path to the HAR file
+
+    Yields:
+        HAR entry dictionaries
+    """
+    with open(har_path, "rb") as f:
+        if ijson is not None:
+            yield from ijson.items(f, "log.entries.item", use_float=True)
+            return
+        har_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    yield from har_data.get("log", {}).get("entries", [])
+
+
 def _attach_har_summary(har_path: Path) -> None:
     """
     Attach a human-readable summary of the HAR file.
@@ -321,31 +609,45 @@ def _attach_har_summary(har_path: Path) -> None:
         har_path: Path to the HAR file
     """
     try:
-        import json
+        # Single pass: count statuses and keep only the 10 slowest requests
+        total_requests = 0
+        status_counts = {}
+        slowest = []
+        for entry in _iter_har_entries(har_path):
+            total_requests += 1
+            request = entry.get("request", {})
+            response = entry.get("response", {})
+            timings = entry.get("timings", {})
 
-        with open(har_path) as f:
-            har_data = json.load(f)
+            status = response.get("status", 0)
+            status_counts[status] = status_counts.get(status, 0) + 1
 
-        # Extract useful information from HAR
-        entries = har_data.get("log", {}).get("entries", [])
+            # HAR uses -1 for timings that do not apply
+            total_time = 0
+            for key in _HAR_TIMING_KEYS:
+                value = timings.get(key, 0)
+                if value > 0:
+                    total_time += value
+
+            # Only build a row for requests that make the current top 10
+            if len(slowest) < 10 or total_time > slowest[0][0]:
+                row = (total_time, total_requests, status, request.get("method", "UNKNOWN"),
+                       request.get("url", "UNKNOWN")[:60])  # Truncate long URLs
+                if len(slowest) < 10:
+                    heapq.heappush(slowest, row)
+                else:
+                    heapq.heapreplace(slowest, row)
 
         # Build summary
         summary_lines = [
             "## Network Activity Summary",
             "",
-            f"**Total Requests:** {len(entries)}",
+            f"**Total Requests:** {total_requests}",
             "",
             "### Request Breakdown by Status:",
             "",
         ]
 
-        # Count by status
-        status_counts = {}
-        for entry in entries:
-            response = entry.get("response", {})
-            status = response.get("status", 0)
-            status_counts[status] = status_counts.get(status, 0) + 1
-
         for status in sorted(status_counts.keys(), reverse=True):
             count = status_counts[status]
             emoji = "✅" if 200 <= status < 300 else "⚠️" if 300 <= status < 400 else "❌"
@@ -359,23 +661,7 @@ def _attach_har_summary(har_path: Path) -> None:
             "|--------|--------|-----|------|",
         ])
 
-        # Sort by total time
-        sorted_entries = sorted(
-            entries,
-            key=lambda e: e.get("timings", {}).get("receive", 0) + e.get("timings", {}).get("wait", 0),
-            reverse=True
-        )[:10]
-
-        for entry in sorted_entries:
-            request = entry.get("request", {})
-            response = entry.get("response", {})
-            timings = entry.get("timings", {})
-
-            total_time = sum(timings.get(k, 0) for k in ["blocked", "dns", "connect", "send", "wait", "receive"])
-            method = request.get("method", "UNKNOWN")
-            url = request.get("url", "UNKNOWN")[:60]  # Truncate long URLs
-            status = response.get("status", 0)
-
+        for total_time, _, status, method, url in sorted(slowest, reverse=True):
             summary_lines.append(f"| {status} | {method} | {url} | {total_time:.0f}ms |")
 
         summary_text = "\n".join(summary_lines)
@@ -395,32 +681,31 @@ def _attach_har_summary(har_path: Path) -> None:
         )
 
 
-def _attach_test_metadata(item, app_name: str) -> None:
+# Framework and Allure markers that are not reported as custom tags
+_BUILT_IN_MARKERS = frozenset({
+    "app", "api", "ui", "e2e", "smoke", "regression", "slow", "critical",
+    "flaky", "integration", "testcase", "requirement", "needs_images",
+    "isolated_context", "fullpage_screenshot", "allure_link",
+    "allure_label", "allure_description", "allure_step", "allure_title",
+    "allure_story", "allure_feature", "allure_epic", "allure_severity",
+    "allure_tag", "allure_id", "allure_issue", "allure_tms", "allure_owner",
+})
+
+
+def _attach_test_metadata(item, app_name: str, markers: dict[str, Any]) -> None:
     """
     Attach test metadata to Allure.
 
     Extracts structured metadata from pytest markers and fixtures,
-    including test case IDs, requirements, and custom tags.
+    including test case IDs, requirements, and custom tags. Skipped for
+    tests with none of these, whose node ID and name Allure already shows.
     """
-    # Extract test_id from testcase marker if present
-    testcase_marker = item.get_closest_marker("testcase")
-    test_id = testcase_marker.args[0] if testcase_marker else item.nodeid
+    requirements = markers["requirements"]
+    custom_tags = markers["custom_tags"]
+    if not (markers["testcase"] or requirements or custom_tags):
+        return
 
-    # Extract requirements from custom markers (format: @pytest.mark.requirement("REQ-123"))
-    requirements = []
-    for mark in item.iter_markers():
-        if mark.name == "requirement" and mark.args:
-            requirements.extend(mark.args)
-
-    # Extract user-defined tags (anything that's not a built-in pytest/allure marker)
-    built_in_markers = {
-        "app", "api", "ui", "e2e", "smoke", "regression", "slow", "critical",
-        "flaky", "integration", "testcase", "requirement", "allure_link",
-        "allure_label", "allure_description", "allure_step", "allure_title",
-        "allure_story", "allure_feature", "allure_epic", "allure_severity",
-        "allure_tag", "allure_id", "allure_issue", "allure_tms", "allure_owner",
-    }
-    custom_tags = [mark.name for mark in item.iter_markers() if mark.name not in built_in_markers]
+    test_id = markers["testcase"] or item.nodeid
 
     metadata: dict[str, Any] = {
         "test_id": test_id,
@@ -435,12 +720,16 @@ def _attach_test_metadata(item, app_name: str) -> None:
     metadata = {k: v for k, v in metadata.items() if v is not None}
 
     allure.attach(
-        json.dumps(metadata, indent=2),
+        dumps_json(metadata),
         name="📋 Test Metadata",
         attachment_type=allure.attachment_type.JSON
     )
 
 
+# Characters that are unsafe in artifact file names, mapped to "_"
+_FILENAME_UNSAFE = str.maketrans(dict.fromkeys('/\\:*?"<>|[]', "_"))
+
+
 def _sanitize_filename(name: str) -> str:
     """
     Sanitize a string to be used as a filename.
@@ -452,9 +741,7 @@ def _sanitize_filename(name: str) -> str:
         Sanitized filename
     """
     # Replace problematic characters
-    for char in ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '[', ']']:
-        name = name.replace(char, '_')
-    return name[:100]  # Limit length
+    return name.translate(_FILENAME_UNSAFE)[:100]  # Limit length
 
 
 @pytest.fixture
@@ -498,6 +785,10 @@ def allure_step():
 # Test Failure Categorization
 # ============================================================================
 
+# Characters kept from each end of a long failure report for categorization
+_CATEGORIZE_CHUNK = 4096
+
+
 def _categorize_failure(item, report) -> None:
     """
     Categorize test failures for better triage and analysis.
@@ -524,8 +815,13 @@ def _categorize_failure(item, report) -> None:
     if not longrepr:
         return
 
-    # Convert to string for pattern matching
+    # Convert to string for pattern matching; pytest puts the test source
+    # first and the raised error last, so huge reports keep both ends
     error_message = str(longrepr)
+    if len(error_message) > 2 * _CATEGORIZE_CHUNK:
+        error_message = (
+            error_message[:_CATEGORIZE_CHUNK] + "\n...\n" + error_message[-_CATEGORIZE_CHUNK:]
+        )
     error_type = None
 
     # Extract error type from longrepr
@@ -533,7 +829,7 @@ def _categorize_failure(item, report) -> None:
         error_type = longrepr.typename
     else:
         # Try to extract error type from string
-        match = re.search(r"(\w+Error)", error_message.split("\n")[0])
+        match = _ERROR_TYPE_RE.search(error_message.split("\n")[0])
         if match:
             error_type = match.group(1)
 
@@ -543,7 +839,7 @@ def _categorize_failure(item, report) -> None:
     # Attach category as a label to Allure
     if category:
         allure.label("category", category)
-        _attach_category_description(category, error_message)
+        _attach_category_description(category)
 
 
 def _determine_category(error_type: str | None, error_message: str, item) -> str:
@@ -574,27 +870,49 @@ def _determine_category(error_type: str | None, error_message: str, item) -> str
     return "Product Bug"
 
 
+# Failure categorization patterns, compiled once at import
+_ERROR_TYPE_RE = re.compile(r"(\w+Error)")
+
+_INFRA_PATTERNS = (
+    r"ConnectionError",
+    r"NewConnectionError",
+    r"MaxRetryError",
+    r"TimeoutError",
+    r"502 Bad Gateway",
+    r"503 Service Unavailable",
+    r"504 Gateway Timeout",
+    r"Connection refused",
+    r"Network.*unreachable",
+    r"Host not found",
+    r"SSL.*error",
+    r"TLS.*error",
+    r"playwright.*Timeout",
+)
+
+_DEFECT_PATTERNS = (
+    r"NoneType.*attribute",
+    r"KeyError",
+    r"NameError.*not defined",
+    r"fixture.*not found",
+)
+
+
+def _combine_patterns(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile patterns into one case-insensitive alternation (single scan)."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+_INFRA_RE = _combine_patterns(_INFRA_PATTERNS)
+_DEFECT_RE = _combine_patterns(_DEFECT_PATTERNS)
+_PERF_RE = _combine_patterns(tuple(
+    re.escape(k) for k in ("timeout", "slow", "performance", "latency", "took too long")
+))
+
+
 def _is_infrastructure_error(error_type: str | None, error_message: str) -> bool:
     """Check if error is infrastructure-related."""
-    infrastructure_patterns = [
-        r"ConnectionError",
-        r"NewConnectionError",
-        r"MaxRetryError",
-        r"TimeoutError",
-        r"502 Bad Gateway",
-        r"503 Service Unavailable",
-        r"504 Gateway Timeout",
-        r"Connection refused",
-        r"Network.*unreachable",
-        r"Host not found",
-        r"SSL.*error",
-        r"TLS.*error",
-        r"playwright.*Timeout",
-    ]
-
-    for pattern in infrastructure_patterns:
-        if re.search(pattern, error_message, re.IGNORECASE):
-            return True
+    if _INFRA_RE.search(error_message):
+        return True
 
     if error_type:
         infra_types = ["ConnectionError", "NewConnectionError", "MaxRetryError", "ConnectTimeout"]
@@ -605,12 +923,8 @@ def _is_infrastructure_error(error_type: str | None, error_message: str) -> bool
 
 def _is_performance_error(error_type: str | None, error_message: str) -> bool:
     """Check if error is performance-related."""
-    performance_keywords = ["timeout", "slow", "performance", "latency", "took too long"]
-
-    error_lower = error_message.lower()
-    for keyword in performance_keywords:
-        if keyword in error_lower:
-            return True
+    if _PERF_RE.search(error_message):
+        return True
 
     if error_type and "Timeout" in error_type:
         return True
@@ -621,20 +935,12 @@ def _is_performance_error(error_type: str | None, error_message: str) -> bool:
 def _is_test_defect(error_type: str | None, error_message: str, item) -> bool:
     """Check if error is in test code."""
     # Check for flaky marker
-    if item.get_closest_marker("flaky"):
+    if _get_markers(item)["flaky"]:
         return True
 
     # Common test code errors
-    test_defect_patterns = [
-        r"NoneType.*attribute",
-        r"KeyError",
-        r"NameError.*not defined",
-        r"fixture.*not found",
-    ]
-
-    for pattern in test_defect_patterns:
-        if re.search(pattern, error_message, re.IGNORECASE):
-            return True
+    if _DEFECT_RE.search(error_message):
+        return True
 
     # Check if traceback points to test file
     if "tests/" in error_message.lower():
@@ -643,10 +949,9 @@ def _is_test_defect(error_type: str | None, error_message: str, item) -> bool:
     return False
 
 
-def _attach_category_description(category: str, error_message: str) -> None:
-    """Attach category description to Allure report."""
-    descriptions = {
-        "Infrastructure Failure": """
+# Markdown descriptions attached for each failure category
+_CATEGORY_DESCRIPTIONS = {
+    "Infrastructure Failure": """
 ## Infrastructure Failure
 
 This test failed due to infrastructure or environmental issues.
@@ -661,7 +966,7 @@ This test failed due to infrastructure or environmental issues.
 - Check network connectivity
 - Re-run test to confirm transient failure
 """,
-        "Performance Issue": """
+    "Performance Issue": """
 ## Performance Issue
 
 This test failed due to performance-related problems.
@@ -676,7 +981,7 @@ This test failed due to performance-related problems.
 - Verify application performance
 - Consider adjusting timeout thresholds
 """,
-        "Test Code Defect": """
+    "Test Code Defect": """
 ## Test Code Defect
 
 This test failed due to an issue with the test code.
@@ -691,7 +996,7 @@ This test failed due to an issue with the test code.
 - Verify test data setup
 - Fix test implementation
 """,
-        "Product Bug": """
+    "Product Bug": """
 ## Product Bug
 
 This test failed due to a defect in the application code.
@@ -706,14 +1011,24 @@ This test failed due to a defect in the application code.
 - Debug application code
 - Create bug ticket if needed
 """,
-    }
+}
+
+# Category descriptions rendered to HTML, filled on first use
+_CATEGORY_HTML: dict[str, str] = {}
 
-    description = descriptions.get(category, "")
-    if description:
+
+def _attach_category_description(category: str) -> None:
+    """Attach category description to Allure report."""
+    html_description = _CATEGORY_HTML.get(category)
+    if html_description is None:
+        description = _CATEGORY_DESCRIPTIONS.get(category, "")
+        if not description:
+            return
         # Convert markdown to HTML for proper rendering in Allure
-        html_description = markdown_to_html(description.strip())
-        allure.attach(
-            html_description,
-            name=f"Category: {category}",
-            attachment_type=allure.attachment_type.HTML
-        )
+        html_description = _CATEGORY_HTML[category] = markdown_to_html(description.strip())
+
+    allure.attach(
+        html_description,
+        name=f"Category: {category}",
+        attachment_type=allure.attachment_type.HTML
+    )
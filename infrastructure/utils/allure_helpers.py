@@ -17,6 +17,58 @@ from typing import Any, Callable
 import allure
 import pytest
 
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    orjson = None
+
+
+# Whether attachments are built at all; switched off by the root conftest when
+# pytest runs without --alluredir (allure.attach would discard them anyway)
+_ALLURE_ENABLED = True
+
+
+def set_allure_enabled(enabled: bool) -> None:
+    """
+    Enable or disable the attach_* helpers.
+
+    Args:
+        enabled: False to make every attach_* helper return without work
+    """
+    global _ALLURE_ENABLED
+    _ALLURE_ENABLED = enabled
+
+
+def allure_enabled() -> bool:
+    """Return whether the attach_* helpers build attachments."""
+    return _ALLURE_ENABLED
+
+
+def dumps_json(data: Any) -> str | bytes:
+    """
+    Serialize data as indented JSON for an Allure attachment.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise (or for data orjson rejects). Both results can be passed
+    straight to ``allure.attach``.
+
+    Args:
+        data: JSON-serializable data; unknown types are converted with str()
+
+    Returns:
+        Indented JSON as bytes (orjson) or str (json)
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=str)
+
 
 def attach_http_request(
     method: str,
@@ -35,6 +87,9 @@ def attach_http_request(
         body: Request body/payload
         description: Optional description of the request
     """
+    if not _ALLURE_ENABLED:
+        return
+
     # Sanitize headers to remove sensitive data
     safe_headers = _sanitize_headers(headers or {})
 
@@ -49,7 +104,7 @@ def attach_http_request(
         request_info["description"] = description
 
     allure.attach(
-        json.dumps(request_info, indent=2, default=str),
+        dumps_json(request_info),
         name=f"📤 Request: {method.upper()} {url}",
         attachment_type=allure.attachment_type.JSON,
     )
@@ -72,6 +127,9 @@ def attach_http_response(
         response_time_ms: Response time in milliseconds
         description: Optional description of the response
     """
+    if not _ALLURE_ENABLED:
+        return
+
     # Determine status icon
     if 200 <= status_code < 300:
         status_icon = "✅"
@@ -107,7 +165,7 @@ def attach_http_response(
         name += f" ({response_time_ms}ms)"
 
     allure.attach(
-        json.dumps(response_info, indent=2, default=str),
+        dumps_json(response_info),
         name=name,
         attachment_type=allure.attachment_type.JSON,
     )
@@ -130,6 +188,9 @@ def attach_performance_metric(
         True if within threshold (or no threshold), False otherwise
     """
     passed = threshold_ms is None or duration_ms <= threshold_ms
+    if not _ALLURE_ENABLED:
+        return passed
+
     status_icon = "✅" if passed else "⏱️"
 
     metric = {
@@ -143,7 +204,7 @@ def attach_performance_metric(
         metric["diff_ms"] = duration_ms - threshold_ms
 
     allure.attach(
-        json.dumps(metric, indent=2),
+        dumps_json(metric),
         name=f"{status_icon} Performance: {operation}",
         attachment_type=allure.attachment_type.JSON,
     )
@@ -166,6 +227,9 @@ def attach_test_metadata(
         requirements: List of requirement IDs
         tags: List of test tags
     """
+    if not _ALLURE_ENABLED:
+        return
+
     metadata: dict[str, Any] = {}
 
     if test_id:
@@ -179,7 +243,7 @@ def attach_test_metadata(
 
     if metadata:
         allure.attach(
-            json.dumps(metadata, indent=2),
+            dumps_json(metadata),
             name="📋 Test Metadata",
             attachment_type=allure.attachment_type.JSON,
         )
@@ -196,6 +260,9 @@ def attach_error_context(
         error: The exception that occurred
         context: Additional context data
     """
+    if not _ALLURE_ENABLED:
+        return
+
     error_info = {
         "type": type(error).__name__,
         "message": str(error),
@@ -203,7 +270,7 @@ def attach_error_context(
     }
 
     allure.attach(
-        json.dumps(error_info, indent=2, default=str),
+        dumps_json(error_info),
         name="❌ Error Context",
         attachment_type=allure.attachment_type.JSON,
     )
@@ -214,8 +281,10 @@ def attach_json_data(
     name: str = "JSON Data",
 ) -> None:
     """Attach JSON data to Allure report."""
+    if not _ALLURE_ENABLED:
+        return
     allure.attach(
-        json.dumps(data, indent=2, default=str),
+        dumps_json(data),
         name=name,
         attachment_type=allure.attachment_type.JSON,
     )
@@ -226,6 +295,8 @@ def attach_text(
     name: str = "Text",
 ) -> None:
     """Attach plain text to Allure report."""
+    if not _ALLURE_ENABLED:
+        return
     allure.attach(
         text,
         name=name,
@@ -288,21 +359,16 @@ def _sanitize_headers(headers: dict) -> dict:
     return sanitized
 
 
+# Common sensitive query params
+_SENSITIVE_QUERY_RE = re.compile(
+    r"([?&])(api[_-]?key|token|auth|password)[=][^&]*", re.IGNORECASE
+)
+
+
 def _sanitize_url(url: str) -> str:
     """Sanitize URL to remove sensitive query parameters."""
     # Remove API keys and tokens from URL
-    import re
-
-    # Pattern to match common sensitive query params
-    patterns = [
-        (r"([?&])(api[_-]?key|token|auth|password)[=][^&]*", r"\1\2=***REDACTED***"),
-    ]
-
-    sanitized = url
-    for pattern, replacement in patterns:
-        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
-
-    return sanitized
+    return _SENSITIVE_QUERY_RE.sub(r"\1\2=***REDACTED***", url)
 
 
 def _sanitize_body(body: Any) -> Any:
@@ -342,6 +408,8 @@ def _sanitize_body(body: Any) -> Any:
 
 def _truncate_body(body: Any, max_size: int = 10000) -> Any:
     """Truncate body if too large for attachment."""
+    # Always measured with json, so whether a body is truncated (and the
+    # truncated payload) does not depend on orjson being installed
     body_str = json.dumps(body, default=str)
 
     if len(body_str) <= max_size:
@@ -355,10 +423,24 @@ def _truncate_body(body: Any, max_size: int = 10000) -> Any:
     }
 
 
+# Markdown patterns used by markdown_to_html
+_MD_H4 = re.compile(r"^### (.+)$", re.MULTILINE)
+_MD_H3 = re.compile(r"^## (.+)$", re.MULTILINE)
+_MD_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_MD_ITALIC = re.compile(r"\*(.+?)\*")
+_MD_CODE_BLOCK = re.compile(r"```(\w*)\n(.+?)```", re.DOTALL)
+_MD_INLINE_CODE = re.compile(r"`(.+?)`")
+_MD_LINK = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)")
+
+
+@functools.lru_cache(maxsize=1024)
 def markdown_to_html(markdown: str) -> str:
     """
     Convert markdown to HTML for use in Allure descriptions.
 
+    Results are memoized (bounded), since descriptions are constant strings
+    and the same text is often shared by several tests and failure categories.
+
     Supports common markdown elements:
     - Headers (##, ###)
     - Bold (**text**)
@@ -383,68 +465,65 @@ def markdown_to_html(markdown: str) -> str:
     html = html.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
     # Headers (##, ###)
-    html = re.sub(r"^### (.+)$", r'<h4>\1</h4>', html, flags=re.MULTILINE)
-    html = re.sub(r"^## (.+)$", r'<h3>\1</h3>', html, flags=re.MULTILINE)
+    html = _MD_H4.sub(r'<h4>\1</h4>', html)
+    html = _MD_H3.sub(r'<h3>\1</h3>', html)
 
     # Bold (**text**)
-    html = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html)
+    html = _MD_BOLD.sub(r"<strong>\1</strong>", html)
 
     # Italic (*text*)
-    html = re.sub(r"\*(.+?)\*", r"<em>\1</em>", html)
+    html = _MD_ITALIC.sub(r"<em>\1</em>", html)
 
     # Code blocks (```code```)
-    html = re.sub(
-        r"```(\w*)\n(.+?)```",
-        r"<pre><code>\2</code></pre>",
-        html,
-        flags=re.DOTALL,
-    )
+    html = _MD_CODE_BLOCK.sub(r"<pre><code>\2</code></pre>", html)
 
     # Inline code (`code`)
-    html = re.sub(r"`(.+?)`", r"<code>\1</code>", html)
+    html = _MD_INLINE_CODE.sub(r"<code>\1</code>", html)
 
     # Links [text](url)
-    html = re.sub(r"\[([^\]]+)\]\(([^\)]+)\)", r'<a href="\2">\1</a>', html)
+    html = _MD_LINK.sub(r'<a href="\2">\1</a>', html)
 
-    # Unordered lists (- item)
-    lines = html.split("\n")
+    # Block structure in one pass over the lines: "- " items become lists,
+    # blank lines separate paragraphs, and block elements are not wrapped in <p>
+    blocks = []
+    paragraph = []
     in_list = False
-    result_lines = []
 
-    for line in lines:
-        if line.strip().startswith("- "):
+    for line in html.split("\n"):
+        stripped = line.strip()
+        if stripped.startswith("- "):
             if not in_list:
-                result_lines.append("<ul>")
+                paragraph.append("<ul>")
                 in_list = True
-            content = line.strip()[2:]
-            result_lines.append(f"  <li>{content}</li>")
-        else:
-            if in_list:
-                result_lines.append("</ul>")
-                in_list = False
-            result_lines.append(line)
+            paragraph.append(f"  <li>{stripped[2:]}</li>")
+            continue
+        if in_list:
+            paragraph.append("</ul>")
+            in_list = False
+        if line:
+            paragraph.append(line)
+        elif paragraph:
+            blocks.append(_wrap_paragraph(paragraph))
+            paragraph = []
 
     if in_list:
-        result_lines.append("</ul>")
+        paragraph.append("</ul>")
+    if paragraph:
+        blocks.append(_wrap_paragraph(paragraph))
 
-    html = "\n".join(result_lines)
+    return "".join(block for block in blocks if block)
 
-    # Paragraphs (double newline)
-    paragraphs = html.split("\n\n")
-    html = "</p><p>".join(p.strip() for p in paragraphs if p.strip())
-    html = f"<p>{html}</p>"
 
-    # Clean up empty paragraphs
-    html = html.replace("<p></p>", "")
-    html = html.replace("<p><ul>", "<ul>")
-    html = html.replace("</ul></p>", "</ul>")
-    html = html.replace("<p><h", "<h")
-    html = html.replace("</h4></p>", "</h4>")
-    html = html.replace("</h3></p>", "</h3>")
-    html = html.replace("<p><pre>", "<pre>")
-    html = html.replace("</pre></p>", "</pre>")
-
-    return html
+def _wrap_paragraph(lines: list[str]) -> str:
+    """Join paragraph lines, wrapping in <p> unless it starts/ends with a block tag."""
+    text = "\n".join(lines).strip()
+    if not text:
+        return ""
+    if not text.startswith(("<ul>", "<h", "<pre>")):
+        text = "<p>" + text
+    if not text.endswith(("</ul>", "</h3>", "</h4>", "</pre>")):
+        text += "</p>"
+    return text
 
 
 def markdown_description(markdown_text: str) -> Callable:
@@ -478,6 +557,61 @@ def markdown_description(markdown_text: str) -> Callable:
     return decorator
 
 
+def defer_description(func: Callable, markdown: str) -> Callable:
+    """
+    Store a markdown description on ``func`` for rendering after collection.
+
+    Conversion to HTML is postponed to :func:`render_deferred_descriptions`,
+    so runs without Allure output never parse the markdown.
+
+    Args:
+        func: Test function to describe
+        markdown: Markdown formatted description
+
+    Returns:
+        The same function
+    """
+    func.__allure_markdown__ = markdown
+    return func
+
+
+def render_deferred_descriptions(items: list) -> None:
+    """
+    Convert stored markdown descriptions to Allure HTML descriptions.
+
+    The description mark is added to each item rather than its function:
+    items copy the function's marks when they are collected, so a mark put
+    on the function afterwards would never be seen by allure-pytest.
+
+    Args:
+        items: Collected pytest items
+    """
+    for item in items:
+        function = getattr(item, "function", None)
+        markdown = getattr(function, "__allure_markdown__", None)
+        if markdown:
+            item.add_marker(allure.description_html(markdown_to_html(markdown)))
+
+
+# Shared decorators are built on first use rather than at import: until
+# allure-pytest's pytest_configure has registered its hooks, allure.label()
+# returns a no-op decorator, and this module is imported before that.
+@functools.lru_cache(maxsize=None)
+def _layer_decorators(layer: str) -> tuple[Callable, ...]:
+    """Return the layer/type labels and marker for ``layer``, built once per layer."""
+    return (
+        allure.label("layer", layer),
+        allure.label("type", "functional"),
+        getattr(pytest.mark, layer),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _app_decorators(app: str) -> tuple[Callable, ...]:
+    """Return the app label and marker for ``app``, built once per app."""
+    return allure.label("app", app), pytest.mark.app(app)
+
+
 def api_test(
     epic: str,
     feature: str,
@@ -543,15 +677,14 @@ def api_test(
         func = allure.epic(epic)(func)
         func = allure.feature(feature)(func)
         func = allure.story(story)(func)
-        func = allure.label("layer", "api")(func)
-        func = allure.label("type", "functional")(func)
-        func = pytest.mark.api(func)
+        for common in _layer_decorators("api"):
+            func = common(func)
         func = pytest.mark.testcase(testcase)(func)
         func = pytest.mark.requirement(requirement)(func)
         func = allure.severity(severity)(func)
 
         if description:
-            func = allure.description_html(markdown_to_html(description))(func)
+            func = defer_description(func, description)
         if title:
             func = allure.title(title)(func)
         if link:
@@ -637,17 +770,14 @@ def e2e_test(
         func = allure.epic(epic)(func)
         func = allure.feature(feature)(func)
         func = allure.story(story)(func)
-        func = allure.label("layer", "e2e")(func)
-        func = allure.label("type", "functional")(func)
-        func = allure.label("app", app)(func)
-        func = pytest.mark.app(app)(func)
-        func = pytest.mark.e2e(func)
+        for common in _layer_decorators("e2e") + _app_decorators(app):
+            func = common(func)
         func = pytest.mark.testcase(testcase)(func)
         func = pytest.mark.requirement(requirement)(func)
         func = allure.severity(severity)(func)
 
         if description:
-            func = allure.description_html(markdown_to_html(description))(func)
+            func = defer_description(func, description)
         if title:
             func = allure.title(title)(func)
         if link:
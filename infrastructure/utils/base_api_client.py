@@ -12,6 +12,7 @@ from typing import Any
 import requests
 
 from infrastructure.utils.allure_helpers import (
+    allure_enabled,
     attach_http_request,
     attach_http_response,
     attach_performance_metric,
@@ -100,15 +101,18 @@ class BaseAPIClient:
         import time
 
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        request_headers = self.session.headers.copy()
-        if headers:
-            request_headers.update(headers)
+        # requests merges session headers itself; the merged view is only
+        # built for the report, and only when there is a report to build
+        display_headers = self.session.headers
+        if headers and allure_enabled():
+            display_headers = requests.structures.CaseInsensitiveDict(display_headers)
+            display_headers.update(headers)
 
         # Attach request to Allure
         attach_http_request(
             method=method,
             url=url,
-            headers=request_headers,
+            headers=display_headers,
             body=json or data,
             description=description,
         )
@@ -121,7 +125,7 @@ class BaseAPIClient:
             params=params,
             json=json,
             data=data,
-            headers=request_headers,
+            headers=headers,
             **kwargs,
         )
         elapsed_ms = int((time.time() - start_time) * 1000)
@@ -8,6 +8,14 @@ from typing import Any
 
 import yaml
 
+try:
+    # libyaml-backed loader, shipped with the PyYAML wheels on most platforms
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+CONFIG_DIR = Path(__file__).resolve().parents[2] / "config"
+
 
 class DataLoader:
     """Utility class for loading test data from files."""
@@ -20,7 +28,7 @@ class DataLoader:
             base_path: Base path for relative file lookups. Defaults to config/
         """
         if base_path is None:
-            base_path = Path(__file__).parent.parent.parent / "config"
+            base_path = CONFIG_DIR
         self.base_path = Path(base_path)
 
     def load_yaml(self, file_path: str | Path) -> dict[str, Any]:
@@ -39,7 +47,7 @@ class DataLoader:
             raise FileNotFoundError(f"YAML file not found: {path}")
 
         with open(path) as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=YamlLoader) or {}
 
     def load_json(self, file_path: str | Path) -> dict[str, Any]:
         """
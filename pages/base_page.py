@@ -11,10 +11,15 @@ class BasePage:
         """Initialize with Playwright page."""
         self.page = page
 
-    def navigate(self, url: str) -> None:
-        """Navigate to URL."""
+    def navigate(self, url: str, wait_until: str = "load") -> None:
+        """
+        Navigate to URL.
+
+        Pass ``wait_until="domcontentloaded"`` for server-rendered pages whose
+        tests only use auto-waiting locators, to skip waiting for subresources.
+        """
         with allure.step(f"Navigate to {url}"):
-            self.page.goto(url)
+            self.page.goto(url, wait_until=wait_until)
 
     def get_by_test_id(self, test_id: str) -> Locator:
         """Get element by data-test attribute."""
@@ -0,0 +1,128 @@
+"""Tests for the composite Allure decorators in allure_helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from infrastructure.utils.allure_helpers import api_test, e2e_test
+
+pytest_plugins = ["pytester"]
+
+
+def _labels(func) -> dict[str, tuple]:
+    """Return the allure labels applied to func as {label_type: values}."""
+    return {
+        mark.kwargs["label_type"]: mark.args
+        for mark in getattr(func, "pytestmark", [])
+        if mark.name == "allure_label"
+    }
+
+
+def _mark_names(func) -> set[str]:
+    return {mark.name for mark in getattr(func, "pytestmark", [])}
+
+
+def test_api_test_applies_layer_and_type_labels():
+    @api_test(
+        epic="Example API",
+        feature="Feature",
+        story="Story",
+        testcase="TC-EX-001",
+        requirement="US-EX-001",
+    )
+    def test_example():
+        pass
+
+    labels = _labels(test_example)
+    assert labels["layer"] == ("api",)
+    assert labels["type"] == ("functional",)
+    assert labels["epic"] == ("Example API",)
+    assert "api" in _mark_names(test_example)
+
+
+@pytest.mark.parametrize("app", ["sauce_demo", "the_internet"])
+def test_e2e_test_applies_layer_type_and_app_labels(app):
+    @e2e_test(
+        epic="Example E2E",
+        feature="Feature",
+        story="Story",
+        testcase="TC-EX-002",
+        requirement="US-EX-002",
+        app=app,
+    )
+    def test_example():
+        pass
+
+    labels = _labels(test_example)
+    assert labels["layer"] == ("e2e",)
+    assert labels["type"] == ("functional",)
+    assert labels["app"] == (app,)
+    assert {"e2e", "app"} <= _mark_names(test_example)
+
+
+def test_deferred_description_is_visible_on_collected_item(pytester):
+    pytester.makeconftest(
+        """
+        from infrastructure.utils.allure_helpers import render_deferred_descriptions
+
+        def pytest_collection_finish(session):
+            render_deferred_descriptions(session.items)
+        """
+    )
+    pytester.makepyfile(
+        """
+        from infrastructure.utils.allure_helpers import api_test
+
+        @api_test(
+            epic="Example API",
+            feature="Feature",
+            story="Story",
+            testcase="TC-EX-003",
+            requirement="US-EX-003",
+            description="Checks **bold** text.",
+        )
+        def test_described():
+            pass
+        """
+    )
+
+    items, _ = pytester.inline_genitems()
+
+    mark = items[0].get_closest_marker("allure_description_html")
+    assert mark is not None
+    assert "<strong>bold</strong>" in mark.args[0]
+
+
+def test_api_test_labels_methods_of_a_class_with_only_an_app_marker(pytester):
+    pytester.makepyfile(
+        """
+        import pytest
+
+        from infrastructure.utils.allure_helpers import api_test
+
+        @pytest.mark.app("example")
+        class TestExample:
+            @api_test(
+                epic="Example API",
+                feature="Feature",
+                story="Story",
+                testcase="TC-EX-004",
+                requirement="US-EX-004",
+            )
+            def test_method(self):
+                pass
+        """
+    )
+
+    items, _ = pytester.inline_genitems()
+
+    labels = {
+        mark.kwargs["label_type"]: mark.args
+        for mark in items[0].iter_markers("allure_label")
+    }
+    assert labels["epic"] == ("Example API",)
+    assert labels["feature"] == ("Feature",)
+    assert labels["layer"] == ("api",)
+    assert labels["type"] == ("functional",)
+    assert items[0].get_closest_marker("api") is not None
+    assert items[0].get_closest_marker("app").args == ("example",)